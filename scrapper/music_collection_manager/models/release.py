@@ -136,6 +136,10 @@ class Release:
     # Raw data from services (for debugging/fallback)
     raw_data: Dict[str, Any] = field(default_factory=dict)
     
+    # Original JSON text of raw_data as loaded from storage, reused when the
+    # release is saved again. Must be cleared whenever raw_data is modified.
+    raw_data_json: Optional[str] = field(default=None, repr=False, compare=False)
+    
     # Local image paths (downloaded artwork)
     local_images: Dict[str, Optional[Path]] = field(default_factory=dict)
     
@@ -1,12 +1,9 @@
 """Artist data orchestrator for coordinating API calls."""
 
 import logging
-import re
-import difflib
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List
 from datetime import datetime
 from pathlib import Path
-from dataclasses import dataclass
 
 from ..models import Artist, Image
 from ..models.enrichment import ArtistAppleMusicData, ArtistSpotifyData, ArtistLastFmData, ArtistTheAudioDBData
@@ -19,124 +16,7 @@ from ..services.theaudiodb import TheAudioDBService
 from .image_manager import ImageManager
 from .database import DatabaseManager
 from .serializers import ArtistSerializer
-
-
-@dataclass
-class ReleaseMatch:
-    """Represents a matched release between services."""
-    discogs_title: str
-    service_title: str
-    match_score: float
-    match_type: str  # 'exact', 'fuzzy', 'partial'
-
-
-class ReleaseVerifier:
-    """Verifies artist matches by comparing releases."""
-    
-    @staticmethod
-    def normalize_title(title: str) -> str:
-        """Normalize album title for comparison."""
-        # Remove common suffixes
-        title = re.sub(r'\s*\([^)]*\)\s*$', '', title)  # Remove (Deluxe Edition), etc.
-        title = re.sub(r'\s*\[[^\]]*\]\s*$', '', title)  # Remove [Remastered], etc.
-        
-        # Remove special characters but keep spaces
-        title = re.sub(r'[^\w\s]', '', title)
-        
-        # Normalize whitespace and case
-        title = ' '.join(title.split()).lower()
-        
-        # Remove common words that cause mismatches
-        skip_words = {'the', 'a', 'an', 'and', '&', 'remastered', 'deluxe', 'edition', 
-                      'expanded', 'anniversary', 'reissue', 'bonus', 'tracks', 'disc'}
-        words = [w for w in title.split() if w not in skip_words]
-        
-        return ' '.join(words)
-    
-    @staticmethod
-    def match_releases(discogs_releases: List[str], service_releases: List[str]) -> List[ReleaseMatch]:
-        """Match releases between Discogs and a service."""
-        matches = []
-        
-        # Normalize all titles
-        normalized_discogs = {ReleaseVerifier.normalize_title(r): r for r in discogs_releases}
-        normalized_service = {ReleaseVerifier.normalize_title(r): r for r in service_releases}
-        
-        # First pass: exact matches
-        for norm_discogs, orig_discogs in normalized_discogs.items():
-            if norm_discogs in normalized_service:
-                matches.append(ReleaseMatch(
-                    discogs_title=orig_discogs,
-                    service_title=normalized_service[norm_discogs],
-                    match_score=1.0,
-                    match_type='exact'
-                ))
-        
-        # Second pass: fuzzy matches for unmatched releases
-        unmatched_discogs = {k: v for k, v in normalized_discogs.items() 
-                           if not any(m.discogs_title == v for m in matches)}
-        unmatched_service = {k: v for k, v in normalized_service.items() 
-                           if not any(m.service_title == v for m in matches)}
-        
-        for norm_discogs, orig_discogs in unmatched_discogs.items():
-            best_match = None
-            best_score = 0.0
-            
-            for norm_service, orig_service in unmatched_service.items():
-                # Calculate similarity
-                score = difflib.SequenceMatcher(None, norm_discogs, norm_service).ratio()
-                
-                # Boost score if key words match
-                discogs_words = set(norm_discogs.split())
-                service_words = set(norm_service.split())
-                if discogs_words and service_words:
-                    word_overlap = len(discogs_words & service_words) / min(len(discogs_words), len(service_words))
-                    score = (score + word_overlap) / 2
-                
-                if score > best_score and score > 0.7:  # 70% threshold
-                    best_score = score
-                    best_match = orig_service
-            
-            if best_match:
-                matches.append(ReleaseMatch(
-                    discogs_title=orig_discogs,
-                    service_title=best_match,
-                    match_score=best_score,
-                    match_type='fuzzy'
-                ))
-        
-        return matches
-    
-    @staticmethod
-    def calculate_confidence(matches: List[ReleaseMatch], total_discogs: int) -> Tuple[float, str]:
-        """Calculate confidence score based on release matches."""
-        if total_discogs == 0:
-            return 0.0, "NO_RELEASES"
-        
-        match_percentage = len(matches) / total_discogs
-        
-        # Calculate weighted score based on match quality
-        if matches:
-            avg_match_score = sum(m.match_score for m in matches) / len(matches)
-            confidence_score = match_percentage * avg_match_score
-        else:
-            confidence_score = 0.0
-        
-        # Determine confidence level
-        if match_percentage >= 0.5 and len(matches) >= 2:
-            confidence = "HIGH"
-        elif match_percentage >= 0.3 or len(matches) >= 1:
-            confidence = "MEDIUM"
-        else:
-            confidence = "LOW"
-        
-        # Special cases
-        if len(matches) >= 5:
-            confidence = "HIGH"  # Many matches = high confidence
-        elif total_discogs == 1 and len(matches) == 1 and matches[0].match_score > 0.9:
-            confidence = "HIGH"  # Single perfect match
-        
-        return confidence_score, confidence
+from .release_verifier import ReleaseMatch, ReleaseVerifier
 
 
 class ArtistDataOrchestrator:
@@ -1280,17 +1160,8 @@ class ArtistDataOrchestrator:
             return []
         
         try:
-            # Query releases table for this artist
-            query = """
-                SELECT DISTINCT title 
-                FROM releases 
-                WHERE artists LIKE ? 
-                ORDER BY title
-            """
-            
-            cursor = self.db_manager.conn.cursor()
-            cursor.execute(query, [f'%"discogs_id": "{discogs_artist_id}"%'])
-            releases = [row[0] for row in cursor.fetchall()]
+            # Look the artist up through the indexed release_artists table
+            releases = self.db_manager.get_release_titles_by_artist(discogs_artist_id)
             
             self.logger.info(f"Found {len(releases)} releases for artist {discogs_artist_id}")
             return releases
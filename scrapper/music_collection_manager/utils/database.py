@@ -11,6 +11,15 @@ from ..models import Release, CollectionItem
 from .serializers import DatabaseSerializer
 
 
+# Artist Discogs IDs of a release, unpacked from its artists JSON array; used
+# to keep the release_artists lookup table in step with releases
+_RELEASE_ARTIST_IDS = """
+    SELECT CAST(json_extract(value, '$.discogs_id') AS TEXT)
+    FROM json_each(CASE WHEN json_valid({artists}) THEN {artists} ELSE '[]' END)
+    WHERE type = 'object' AND json_extract(value, '$.discogs_id') IS NOT NULL
+"""
+
+
 class DatabaseManager:
     """Manages SQLite database operations."""
     
@@ -188,6 +197,52 @@ class DatabaseManager:
                 self.logger.info("Adding local_images column for local image paths")
                 conn.execute("ALTER TABLE releases ADD COLUMN local_images TEXT")  # JSON object
                 conn.commit()
+            
+            # Add an indexed release -> artist Discogs ID table so artist
+            # lookups don't have to LIKE-scan the artists JSON of every release
+            cursor = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'release_artists'"
+            )
+            if not cursor.fetchone():
+                self.logger.info("Adding release_artists lookup table")
+                conn.execute("""
+                    CREATE TABLE release_artists (
+                        release_id TEXT NOT NULL,
+                        discogs_id TEXT NOT NULL
+                    )
+                """)
+                conn.execute("CREATE INDEX idx_release_artists_discogs_id ON release_artists (discogs_id)")
+                conn.execute("CREATE INDEX idx_release_artists_release_id ON release_artists (release_id)")
+                
+                select_ids = _RELEASE_ARTIST_IDS.format(artists='NEW.artists')
+                conn.execute(f"""
+                    CREATE TRIGGER release_artists_insert AFTER INSERT ON releases BEGIN
+                        DELETE FROM release_artists WHERE release_id = NEW.id;
+                        INSERT INTO release_artists (release_id, discogs_id)
+                        SELECT NEW.id, * FROM ({select_ids});
+                    END
+                """)
+                conn.execute(f"""
+                    CREATE TRIGGER release_artists_update AFTER UPDATE OF id, artists ON releases BEGIN
+                        DELETE FROM release_artists WHERE release_id = OLD.id;
+                        INSERT INTO release_artists (release_id, discogs_id)
+                        SELECT NEW.id, * FROM ({select_ids});
+                    END
+                """)
+                conn.execute("""
+                    CREATE TRIGGER release_artists_delete AFTER DELETE ON releases BEGIN
+                        DELETE FROM release_artists WHERE release_id = OLD.id;
+                    END
+                """)
+                
+                # Backfill from the releases already in the database
+                for release_id, artists in conn.execute("SELECT id, artists FROM releases").fetchall():
+                    conn.execute(
+                        f"INSERT INTO release_artists (release_id, discogs_id) "
+                        f"SELECT ?, * FROM ({_RELEASE_ARTIST_IDS.format(artists='?')})",
+                        (release_id, artists, artists),
+                    )
+                conn.commit()
                 
         except Exception as e:
             self.logger.warning(f"Migration error (non-critical): {str(e)}")
@@ -279,6 +334,23 @@ class DatabaseManager:
         
         return None
     
+    def get_release_titles_by_artist(self, discogs_artist_id: str) -> List[str]:
+        """Get the distinct release titles credited to an artist Discogs ID."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute("""
+                    SELECT DISTINCT r.title
+                    FROM releases r
+                    JOIN release_artists ra ON ra.release_id = r.id
+                    WHERE ra.discogs_id = ?
+                    ORDER BY r.title
+                """, (str(discogs_artist_id),))
+                return [row[0] for row in cursor.fetchall()]
+                
+        except Exception as e:
+            self.logger.error(f"Failed to get releases for artist {discogs_artist_id}: {str(e)}")
+            return []
+    
     def get_all_releases(self, limit: Optional[int] = None) -> List[Release]:
         """Get all releases from database."""
         releases = []
@@ -371,7 +443,8 @@ class DatabaseManager:
             created_at=datetime.fromisoformat(row["created_at"]),
             updated_at=datetime.fromisoformat(row["updated_at"]),
             date_added=date_added,
-            raw_data=json.loads(row["raw_data"] or "{}")
+            raw_data=json.loads(row["raw_data"] or "{}"),
+            raw_data_json=row["raw_data"] or None
         )
         
         return release
@@ -618,6 +691,7 @@ class DatabaseManager:
             lastfm_url=data.get('lastfm_url'),
             date_added=date_added,
             raw_data=raw_data,
+            raw_data_json=data.get('raw_data') or None,
             local_images={k: Path(v) if v else None for k, v in local_images_data.items()}
         )
         
@@ -1,6 +1,7 @@
 """Music data orchestrator for coordinating API calls."""
 
 import logging
+from itertools import islice
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
@@ -15,11 +16,15 @@ from ..services.base import ServiceError
 from .image_manager import ImageManager
 from .database import DatabaseManager
 from .artist_orchestrator import ArtistDataOrchestrator
+from .serializers import ReleaseSerializer
 
 
 class MusicDataOrchestrator:
     """Orchestrates data collection from multiple music services."""
     
+    # Maximum number of search results offered in interactive match selection
+    MAX_INTERACTIVE_CANDIDATES = 20
+    
     def __init__(self, config: Dict[str, Any], logger: Optional[logging.Logger] = None):
         self.config = config
         self.logger = logger or logging.getLogger(__name__)
@@ -164,15 +169,17 @@ class MusicDataOrchestrator:
             if collection_date_added:
                 release.date_added = collection_date_added
             
-            # Enrich with other services
-            release = self.enrich_release(release)
-            
-            # Save enriched release to database
-            try:
-                self.db_manager.save_release(release)
-                self.logger.info(f"Saved enriched release {discogs_id} to database")
-            except Exception as e:
-                self.logger.warning(f"Failed to save release to database: {str(e)}")
+            # Enrich with other services, sharing serialized enrichment data
+            # between the release JSON and the database row
+            with ReleaseSerializer.batch_context():
+                release = self.enrich_release(release)
+                
+                # Save enriched release to database
+                try:
+                    self.db_manager.save_release(release)
+                    self.logger.info(f"Saved enriched release {discogs_id} to database")
+                except Exception as e:
+                    self.logger.warning(f"Failed to save release to database: {str(e)}")
             
             return release
             
@@ -182,6 +189,9 @@ class MusicDataOrchestrator:
     
     def enrich_release(self, release: Release) -> Release:
         """Enrich a release with data from all available services."""
+        # raw_data is about to change, so any stored JSON text is stale
+        release.raw_data_json = None
+        
         # Get primary artist name for searches
         primary_artist = release.get_artist_names()[0] if release.get_artist_names() else ""
         
@@ -619,7 +629,7 @@ class MusicDataOrchestrator:
         candidates = []
         if service_name == "Apple Music":
             albums = search_results.get("results", {}).get("albums", {}).get("data", [])
-            for album in albums:
+            for album in islice(albums, self.MAX_INTERACTIVE_CANDIDATES):
                 attrs = album.get("attributes", {})
                 candidates.append({
                     "data": album,
@@ -630,7 +640,7 @@ class MusicDataOrchestrator:
                 })
         elif service_name == "Spotify":
             albums = search_results.get("albums", {}).get("items", [])
-            for album in albums:
+            for album in islice(albums, self.MAX_INTERACTIVE_CANDIDATES):
                 artists = [a.get("name", "") for a in album.get("artists", [])]
                 candidates.append({
                     "data": album,
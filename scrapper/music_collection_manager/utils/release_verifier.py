@@ -0,0 +1,215 @@
+"""Release matching used to verify artist matches across services."""
+
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Tuple
+
+from rapidfuzz import fuzz, process
+
+
+# Patterns and stop words used by ReleaseVerifier.normalize_title
+_PAREN_SUFFIX = re.compile(r'\s*\([^)]*\)\s*$')
+_BRACK_SUFFIX = re.compile(r'\s*\[[^\]]*\]\s*$')
+_NONWORD = re.compile(r'[^\w\s]')
+_SKIP_WORDS = frozenset({'the', 'a', 'an', 'and', '&', 'remastered', 'deluxe', 'edition',
+                         'expanded', 'anniversary', 'reissue', 'bonus', 'tracks', 'disc'})
+
+# ASCII characters matched by _NONWORD, for the str.translate fast path
+_ASCII_NONWORD_TABLE = {
+    i: None for i in range(128)
+    if not (chr(i).isalnum() or chr(i).isspace() or chr(i) == '_')
+}
+
+
+# dataclass(slots=True) needs Python 3.10. A hand-written __slots__ would
+# clash with the native class mypyc builds for this module.
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class ReleaseMatch:
+    """Represents a matched release between services."""
+    discogs_title: str
+    service_title: str
+    match_score: float
+    match_type: str  # 'exact', 'fuzzy', 'partial'
+
+
+def _max_weight_assignment(scores: List[List[float]]) -> List[Tuple[int, int]]:
+    """Pair rows with columns one-to-one so the total score is as high as possible.
+    
+    Hungarian algorithm on the negated scores; returns (row, column) index pairs.
+    """
+    transpose = len(scores) > len(scores[0])
+    if transpose:
+        scores = [list(column) for column in zip(*scores)]
+    n, m = len(scores), len(scores[0])
+    
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    owner = [0] * (m + 1)  # 1-based row assigned to each column
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        owner[0] = i
+        j0 = 0
+        min_slack = [float('inf')] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = owner[j0]
+            row = scores[i0 - 1]
+            delta = float('inf')
+            j1 = 0
+            for j in range(1, m + 1):
+                if not used[j]:
+                    slack = -row[j - 1] - u[i0] - v[j]
+                    if slack < min_slack[j]:
+                        min_slack[j] = slack
+                        way[j] = j0
+                    if min_slack[j] < delta:
+                        delta = min_slack[j]
+                        j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[owner[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_slack[j] -= delta
+            j0 = j1
+            if owner[j0] == 0:
+                break
+        # Flip the augmenting path
+        while j0:
+            j1 = way[j0]
+            owner[j0] = owner[j1]
+            j0 = j1
+    
+    pairs = [(owner[j] - 1, j - 1) for j in range(1, m + 1) if owner[j]]
+    if transpose:
+        pairs = [(j, i) for i, j in pairs]
+    return pairs
+
+
+class ReleaseVerifier:
+    """Verifies artist matches by comparing releases.
+    
+    An instance holds one artist's normalized Discogs titles, so they can be
+    matched against several services without normalizing them again.
+    """
+    
+    def __init__(self, discogs_releases: List[str]):
+        self._normalized_discogs = {ReleaseVerifier.normalize_title(r): r for r in discogs_releases}
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def normalize_title(title: str) -> str:
+        """Normalize album title for comparison."""
+        # Remove common suffixes
+        title = _PAREN_SUFFIX.sub('', title)  # Remove (Deluxe Edition), etc.
+        title = _BRACK_SUFFIX.sub('', title)  # Remove [Remastered], etc.
+        
+        # Remove special characters but keep spaces
+        if title.isascii():
+            title = title.translate(_ASCII_NONWORD_TABLE)
+        else:
+            title = _NONWORD.sub('', title)
+        
+        # Normalize whitespace and case
+        title = ' '.join(title.split()).lower()
+        
+        # Remove common words that cause mismatches
+        words = [w for w in title.split() if w not in _SKIP_WORDS]
+        
+        return ' '.join(words)
+    
+    @staticmethod
+    def match_releases(discogs_releases: List[str], service_releases: List[str]) -> List[ReleaseMatch]:
+        """Match releases between Discogs and a service."""
+        return ReleaseVerifier(discogs_releases).match(service_releases)
+    
+    def match(self, service_releases: List[str]) -> List[ReleaseMatch]:
+        """Match this artist's Discogs releases against a service's releases."""
+        matches = []
+        
+        # Normalize the service titles; the Discogs side was done once up front
+        normalized_discogs = self._normalized_discogs
+        normalized_service = {ReleaseVerifier.normalize_title(r): r for r in service_releases}
+        
+        # First pass: exact matches, emitted in Discogs order
+        exact_keys = normalized_discogs.keys() & normalized_service.keys()
+        for norm_discogs, orig_discogs in normalized_discogs.items():
+            if norm_discogs in exact_keys:
+                matches.append(ReleaseMatch(
+                    discogs_title=orig_discogs,
+                    service_title=normalized_service[norm_discogs],
+                    match_score=1.0,
+                    match_type='exact'
+                ))
+        
+        # Second pass: fuzzy matches for unmatched releases
+        unmatched_discogs = {k: v for k, v in normalized_discogs.items() if k not in exact_keys}
+        unmatched_service = {k: v for k, v in normalized_service.items() if k not in exact_keys}
+        
+        discogs_keys = list(unmatched_discogs)
+        service_keys = list(unmatched_service)
+        if discogs_keys and service_keys:
+            # token_set_ratio scores shared words as a full match on their own,
+            # which covers the old word-overlap boost; pairs at or below the
+            # 70% threshold stay at zero
+            scores = []
+            for norm_discogs in discogs_keys:
+                row = [0.0] * len(service_keys)
+                for _, score, index in process.extract(norm_discogs, service_keys,
+                                                       scorer=fuzz.token_set_ratio,
+                                                       score_cutoff=70, limit=None):
+                    if score > 70:
+                        row[index] = score
+                scores.append(row)
+            
+            # Assign each service title to at most one Discogs title
+            for i, j in sorted(_max_weight_assignment(scores)):
+                if scores[i][j]:
+                    matches.append(ReleaseMatch(
+                        discogs_title=unmatched_discogs[discogs_keys[i]],
+                        service_title=unmatched_service[service_keys[j]],
+                        match_score=scores[i][j] / 100,
+                        match_type='fuzzy'
+                    ))
+        
+        return matches
+    
+    @staticmethod
+    def calculate_confidence(matches: List[ReleaseMatch], total_discogs: int) -> Tuple[float, str]:
+        """Calculate confidence score based on release matches."""
+        if total_discogs == 0:
+            return 0.0, "NO_RELEASES"
+        
+        match_count = len(matches)
+        match_percentage = match_count / total_discogs
+        
+        # Calculate weighted score based on match quality
+        if matches:
+            total_score = 0.0
+            for m in matches:
+                total_score += m.match_score
+            confidence_score = match_percentage * (total_score / match_count)
+        else:
+            confidence_score = 0.0
+        
+        # Determine confidence level
+        if match_percentage >= 0.5 and match_count >= 2:
+            confidence = "HIGH"
+        elif match_percentage >= 0.3 or match_count >= 1:
+            confidence = "MEDIUM"
+        else:
+            confidence = "LOW"
+        
+        # Special cases
+        if match_count >= 5:
+            confidence = "HIGH"  # Many matches = high confidence
+        elif total_discogs == 1 and match_count == 1 and matches[0].match_score > 0.9:
+            confidence = "HIGH"  # Single perfect match
+        
+        return confidence_score, confidence
@@ -1,12 +1,68 @@
 """Centralized serialization utilities for consistent data handling across JSON and database storage."""
 
 import json
-from typing import Any, Dict, Optional
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
+from operator import attrgetter
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
 from ..models import Release, Artist, Track, Image
-from ..models.enrichment import AppleMusicData, SpotifyData, LastFmData, WikipediaData
+from ..models.enrichment import (
+    AppleMusicData,
+    SpotifyData,
+    LastFmData,
+    WikipediaData,
+    ArtistAppleMusicData,
+    ArtistSpotifyData,
+    ArtistLastFmData,
+)
+
+
+# Release ID attributes and the service label reported in processing_info
+_SERVICE_FIELDS = (
+    ('discogs_id', 'discogs'),
+    ('apple_music_id', 'apple_music'),
+    ('spotify_id', 'spotify'),
+    ('lastfm_mbid', 'lastfm'),
+)
+
+# Attribute fetchers for the small artist/image/track dicts built per release.
+# Keys are listed alphabetically so JSON output is canonical without sort_keys.
+_ARTIST_KEYS = (
+    'apple_music_id', 'biography', 'discogs_id', 'id', 'lastfm_mbid',
+    'name', 'role', 'spotify_id', 'wikipedia_url',
+)
+_ARTIST_KEYS_WITH_ORIGINAL_NAME = _ARTIST_KEYS[:3] + ('discogs_original_name',) + _ARTIST_KEYS[3:]
+_ARTIST_GETTER = attrgetter(*_ARTIST_KEYS)
+_IMG_KEYS = ('height', 'resource_url', 'type', 'url', 'width')
+_IMG_GETTER = attrgetter(*_IMG_KEYS)
+_DB_IMG_KEYS = ('height', 'type', 'url', 'width')
+_DB_IMG_GETTER = attrgetter(*_DB_IMG_KEYS)
+_TRACK_KEYS = ('duration', 'position', 'title')
+_TRACK_GETTER = attrgetter(*_TRACK_KEYS)
+
+# Batches smaller than this are serialized in-process
+_PARALLEL_THRESHOLD = 100
+
+# Per-thread batch state: the enrichment cache used by ReleaseSerializer.batch_context()
+# and the shared timestamp set by ReleaseSerializer.processing_batch()
+_batch_state = threading.local()
+
+
+def _canonicalize(value: Any) -> Any:
+    """Recursively rebuild dicts with sorted keys for variable-structure service data."""
+    if isinstance(value, dict):
+        return {key: _canonicalize(value[key]) for key in sorted(value)}
+    if isinstance(value, (list, tuple)):
+        return [_canonicalize(item) for item in value]
+    return value
 
 
 class ReleaseSerializer:
@@ -24,108 +80,145 @@ class ReleaseSerializer:
         Returns:
             Dictionary representation of the release
         """
-        data = {
-            'id': release.id,
-            'title': release.title,
-            'discogs_id': release.discogs_id,
-            'year': release.year,
-            'released': release.released,
+        # Serialize each distinct artist once; track artists usually repeat the
+        # release artists, so the resulting dicts are shared rather than rebuilt
+        artist_cache = {id(artist): ReleaseSerializer._serialize_artist(artist) for artist in release.artists}
+        
+        # Local images if available
+        local_images = getattr(release, 'local_images', None) or {}
+        
+        # Keys are inserted in alphabetical order; the enrichment keys are
+        # filled in place and removed again when not requested
+        data: Dict[str, Any] = {
+            'apple_music_id': release.apple_music_id,
+            'apple_music_url': release.apple_music_url,
+            'artists': [artist_cache[id(artist)] for artist in release.artists],
+            'artists_wikipedia': None,
             'country': release.country,
+            'created_at': release.created_at.isoformat() if release.created_at else None,
+            'date_added': release.date_added.isoformat() if release.date_added else None,
+            'discogs_id': release.discogs_id,
+            'discogs_url': release.discogs_url,
             'formats': release.formats,
-            'labels': release.labels,
             'genres': release.genres,
-            'styles': release.styles,
-            
-            # Service-specific release names
-            'release_name_discogs': release.release_name_discogs,
+            'id': release.id,
+            'images': [ReleaseSerializer._serialize_image(image) for image in release.images],
+            'labels': release.labels,
+            'lastfm_mbid': release.lastfm_mbid,
+            'lastfm_url': release.lastfm_url,
+            'local_images': {
+                size: str(local_images[size]) if local_images[size] else None
+                for size in sorted(local_images)
+            },
+            'processing_info': None,
             'release_name_apple_music': release.release_name_apple_music,
+            'release_name_discogs': release.release_name_discogs,
             'release_name_spotify': release.release_name_spotify,
-            
-            # External IDs
-            'apple_music_id': release.apple_music_id,
+            'released': release.released,
+            'services': None,
             'spotify_id': release.spotify_id,
-            'lastfm_mbid': release.lastfm_mbid,
-            
-            # URLs
-            'discogs_url': release.discogs_url,
-            'apple_music_url': release.apple_music_url,
             'spotify_url': release.spotify_url,
-            'lastfm_url': release.lastfm_url,
-            
-            # Metadata
-            'created_at': release.created_at.isoformat() if release.created_at else None,
+            'styles': release.styles,
+            'title': release.title,
+            'tracklist': [ReleaseSerializer._serialize_track(track, artist_cache) for track in release.tracklist],
             'updated_at': release.updated_at.isoformat() if release.updated_at else None,
-            'date_added': release.date_added.isoformat() if release.date_added else None,
-            
-            # Structured data
-            'artists': [ReleaseSerializer._serialize_artist(artist) for artist in release.artists],
-            'images': [ReleaseSerializer._serialize_image(image) for image in release.images],
-            'tracklist': [ReleaseSerializer._serialize_track(track) for track in release.tracklist],
-            
-            # Local images if available
-            'local_images': {}
+            'year': release.year,
         }
         
-        # Add local images if available
-        if hasattr(release, 'local_images') and release.local_images:
-            data['local_images'] = {
-                size: str(path) if path else None
-                for size, path in release.local_images.items()
-            }
-        
         # Add enrichment data if requested
         if include_enrichment:
-            data['services'] = ReleaseSerializer._serialize_enrichment_data(release)
+            data['services'] = _canonicalize(ReleaseSerializer._serialize_enrichment_data(release))
             data['artists_wikipedia'] = ReleaseSerializer._serialize_artist_wikipedia(release)
             data['processing_info'] = ReleaseSerializer._serialize_processing_info(release)
+        else:
+            del data['artists_wikipedia'], data['processing_info'], data['services']
         
         return data
     
     @staticmethod
     def _serialize_artist(artist: Artist) -> Dict[str, Any]:
         """Serialize an Artist object."""
-        data = {
-            'id': artist.id,
-            'name': artist.name,
-            'role': artist.role,
-            'biography': artist.biography,
-            'discogs_id': artist.discogs_id,
-            'apple_music_id': artist.apple_music_id,
-            'spotify_id': artist.spotify_id,
-            'lastfm_mbid': artist.lastfm_mbid,
-            'wikipedia_url': artist.wikipedia_url,
-        }
+        values = _ARTIST_GETTER(artist)
         
         # Include raw_data if it contains discogs info
-        if hasattr(artist, 'raw_data') and 'discogs' in artist.raw_data:
-            data['discogs_original_name'] = artist.raw_data['discogs'].get('original_name', artist.name)
+        raw_data = getattr(artist, 'raw_data', None)
+        discogs_data = raw_data.get('discogs') if raw_data else None
+        if discogs_data:
+            original_name = discogs_data.get('original_name', artist.name)
+            return dict(zip(_ARTIST_KEYS_WITH_ORIGINAL_NAME, values[:3] + (original_name,) + values[3:]))
         
-        return data
+        return dict(zip(_ARTIST_KEYS, values))
     
     @staticmethod
     def _serialize_image(image: Image) -> Dict[str, Any]:
         """Serialize an Image object."""
-        return {
-            'url': image.url,
-            'type': image.type,
-            'width': image.width,
-            'height': image.height,
-            'resource_url': image.resource_url,
-        }
+        return dict(zip(_IMG_KEYS, _IMG_GETTER(image)))
     
     @staticmethod
-    def _serialize_track(track: Track) -> Dict[str, Any]:
-        """Serialize a Track object."""
-        return {
-            'position': track.position,
-            'title': track.title,
-            'duration': track.duration,
-            'artists': [ReleaseSerializer._serialize_artist(artist) for artist in track.artists],
-        }
+    def _serialize_track(track: Track, artist_cache: Optional[Dict[int, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Serialize a Track object, reusing already serialized artists from artist_cache."""
+        if artist_cache is None:
+            artist_cache = {}
+        artists = []
+        for artist in track.artists:
+            serialized = artist_cache.get(id(artist))
+            if serialized is None:
+                serialized = artist_cache[id(artist)] = ReleaseSerializer._serialize_artist(artist)
+            artists.append(serialized)
+        data = {'artists': artists}
+        data.update(zip(_TRACK_KEYS, _TRACK_GETTER(track)))
+        return data
+    
+    @staticmethod
+    @contextmanager
+    def batch_context() -> Iterator[None]:
+        """
+        Share serialized enrichment data between JSON and database output.
+        
+        Inside the context, enrichment data is built once per release and reused
+        by both to_dict and DatabaseSerializer.to_database_row. Releases must not
+        have their raw_data changed while the context is active.
+        """
+        outer = getattr(_batch_state, 'enrichment', None)
+        if outer is None:
+            _batch_state.enrichment = {}
+        try:
+            yield
+        finally:
+            if outer is None:
+                _batch_state.enrichment = None
+    
+    @staticmethod
+    @contextmanager
+    def processing_batch(processed_at: Optional[str] = None) -> Iterator[str]:
+        """
+        Use a single processing timestamp for everything serialized in the context.
+        
+        Args:
+            processed_at: ISO timestamp to use (defaults to now)
+            
+        Yields:
+            The timestamp in effect for the batch
+        """
+        outer = getattr(_batch_state, 'processed_at', None)
+        if outer is not None:
+            yield outer
+            return
+        _batch_state.processed_at = processed_at or datetime.now().isoformat()
+        try:
+            yield _batch_state.processed_at
+        finally:
+            _batch_state.processed_at = None
     
     @staticmethod
     def _serialize_enrichment_data(release: Release) -> Dict[str, Any]:
         """Serialize enrichment data from all services."""
+        cache = getattr(_batch_state, 'enrichment', None)
+        if cache is not None:
+            cached = cache.get(id(release))
+            if cached is not None and cached[0] is release:
+                return cached[1]
+        
         services = {}
         
         if hasattr(release, 'raw_data') and release.raw_data:
@@ -144,12 +237,14 @@ class ReleaseSerializer:
                 lastfm_data = release.raw_data['lastfm']
                 services['lastfm'] = ReleaseSerializer._serialize_lastfm_data(lastfm_data)
         
+        if cache is not None:
+            cache[id(release)] = (release, services)
         return services
     
     @staticmethod
     def _serialize_apple_music_data(apple_data: Any) -> Dict[str, Any]:
         """Serialize Apple Music data."""
-        if hasattr(apple_data, '__dict__'):
+        if isinstance(apple_data, AppleMusicData):
             return {
                 'id': getattr(apple_data, 'id', None),
                 'url': getattr(apple_data, 'url', None),
@@ -166,7 +261,7 @@ class ReleaseSerializer:
     @staticmethod
     def _serialize_spotify_data(spotify_data: Any) -> Dict[str, Any]:
         """Serialize Spotify data."""
-        if hasattr(spotify_data, '__dict__'):
+        if isinstance(spotify_data, SpotifyData):
             return {
                 'id': getattr(spotify_data, 'id', None),
                 'url': getattr(spotify_data, 'url', None),
@@ -190,7 +285,7 @@ class ReleaseSerializer:
     @staticmethod
     def _serialize_lastfm_data(lastfm_data: Any) -> Dict[str, Any]:
         """Serialize Last.fm data."""
-        if hasattr(lastfm_data, '__dict__'):
+        if isinstance(lastfm_data, LastFmData):
             return {
                 'url': getattr(lastfm_data, 'url', None),
                 'mbid': getattr(lastfm_data, 'mbid', None),
@@ -214,33 +309,25 @@ class ReleaseSerializer:
         for artist in release.artists:
             if artist.wikipedia_url or artist.biography:
                 wikipedia_data[artist.name] = {
-                    'wikipedia_url': artist.wikipedia_url,
-                    'biography': artist.biography
+                    'biography': artist.biography,
+                    'wikipedia_url': artist.wikipedia_url
                 }
-        return wikipedia_data
+        return {name: wikipedia_data[name] for name in sorted(wikipedia_data)}
     
     @staticmethod
     def _serialize_processing_info(release: Release) -> Dict[str, Any]:
         """Serialize processing metadata."""
         # Determine which services were used based on available data
-        services_used = []
-        if release.discogs_id:
-            services_used.append('discogs')
-        if release.apple_music_id:
-            services_used.append('apple_music')
-        if release.spotify_id:
-            services_used.append('spotify')
-        if release.lastfm_mbid:
-            services_used.append('lastfm')
+        services_used = [label for attr, label in _SERVICE_FIELDS if getattr(release, attr)]
         # Check for Wikipedia data in artists
         if any(artist.wikipedia_url or artist.biography for artist in release.artists):
             services_used.append('wikipedia')
             
         return {
-            'processed_at': datetime.now().isoformat(),
-            'services_used': services_used,
             'has_local_images': bool(getattr(release, 'local_images', {})),
-            'local_images_count': len([path for path in getattr(release, 'local_images', {}).values() if path])
+            'local_images_count': len([path for path in getattr(release, 'local_images', {}).values() if path]),
+            'processed_at': getattr(_batch_state, 'processed_at', None) or datetime.now().isoformat(),
+            'services_used': services_used
         }
     
     @staticmethod
@@ -259,16 +346,65 @@ class ReleaseSerializer:
         data = ReleaseSerializer.to_dict(release, include_enrichment)
         
         # Default JSON options
-        json_options = {
+        # Keys are already in sorted order (see to_dict), so sort_keys is not needed
+        json_options: Dict[str, Any] = {
             'indent': 2,
             'ensure_ascii': False,
-            'sort_keys': True,
             'default': ReleaseSerializer._json_serializer
         }
         json_options.update(kwargs)
         
         return json.dumps(data, **json_options)
     
+    @staticmethod
+    def to_json_batch(releases: List[Release], workers: Optional[int] = None) -> List[str]:
+        """
+        Convert many releases to JSON strings, using worker processes for large batches.
+        
+        Args:
+            releases: Release objects to serialize
+            workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            JSON strings in the same order as the input releases
+        """
+        with ReleaseSerializer.processing_batch() as processed_at:
+            if len(releases) < _PARALLEL_THRESHOLD:
+                return [ReleaseSerializer.to_json(release) for release in releases]
+            
+            with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+                return list(executor.map(
+                    _release_to_json, releases, repeat(processed_at), chunksize=32
+                ))
+    
+    @staticmethod
+    def dump_many(releases: Iterable[Release], fp: BinaryIO, include_enrichment: bool = True) -> int:
+        """
+        Stream releases to a binary file as a single JSON array.
+        
+        Each release is converted and encoded on its own, so only one release
+        dictionary is held in memory at a time.
+        
+        Args:
+            releases: Iterable of Release objects to serialize
+            fp: Binary file object to write to
+            include_enrichment: Whether to include enriched service data
+            
+        Returns:
+            Number of releases written
+        """
+        count = 0
+        fp.write(b'[')
+        with ReleaseSerializer.processing_batch():
+            for release in releases:
+                if count:
+                    fp.write(b',')
+                data = ReleaseSerializer.to_dict(release, include_enrichment)
+                fp.write(orjson.dumps(data, default=ReleaseSerializer._json_serializer))
+                count += 1
+        fp.write(b']')
+        return count
+    
     @staticmethod
     def _json_serializer(obj: Any) -> str:
         """Custom JSON serializer for special types."""
@@ -280,6 +416,12 @@ class ReleaseSerializer:
             return str(obj)
 
 
+def _release_to_json(release: Release, processed_at: str) -> str:
+    """Process pool worker for ReleaseSerializer.to_json_batch."""
+    with ReleaseSerializer.processing_batch(processed_at):
+        return ReleaseSerializer.to_json(release)
+
+
 class DatabaseSerializer:
     """Serializer specifically for database storage with flattened structure."""
     
@@ -323,7 +465,7 @@ class DatabaseSerializer:
             'updated_at': release.updated_at.isoformat() if release.updated_at else None,
             'date_added': release.date_added.isoformat() if release.date_added else None,
             'local_images': json.dumps({k: str(v) if v else None for k, v in release.local_images.items()}, default=ReleaseSerializer._json_serializer) if release.local_images else '{}',
-            'raw_data': json.dumps(release.raw_data, default=ReleaseSerializer._json_serializer) if release.raw_data else '{}'
+            'raw_data': DatabaseSerializer._serialize_raw_data(release)
         }
     
     @staticmethod
@@ -338,21 +480,25 @@ class DatabaseSerializer:
     @staticmethod
     def _db_serialize_image(image: Image) -> Dict[str, Any]:
         """Serialize image for database storage."""
-        return {
-            'url': image.url,
-            'type': image.type,
-            'width': image.width,
-            'height': image.height
-        }
+        return dict(zip(_DB_IMG_KEYS, _DB_IMG_GETTER(image)))
     
     @staticmethod
     def _db_serialize_track(track: Track) -> Dict[str, Any]:
         """Serialize track for database storage."""
-        return {
-            'position': track.position,
-            'title': track.title,
-            'duration': track.duration
-        }
+        return dict(zip(_TRACK_KEYS, _TRACK_GETTER(track)))
+    
+    @staticmethod
+    def _serialize_raw_data(release: Release) -> str:
+        """Serialize raw service data, reusing the stored JSON text when unchanged."""
+        if release.raw_data_json:
+            return release.raw_data_json
+        if not release.raw_data:
+            return '{}'
+        return orjson.dumps(
+            release.raw_data,
+            default=ReleaseSerializer._json_serializer,
+            option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME,
+        ).decode()
     
     @staticmethod
     def _serialize_enrichment_for_db(release: Release) -> str:
@@ -377,58 +523,44 @@ class ArtistSerializer:
         Returns:
             Dictionary representation of the artist
         """
-        data = {
-            'id': artist.id,
-            'name': artist.name,
+        # Keys are inserted in alphabetical order; the enrichment keys are
+        # filled in place and removed again when not included
+        data: Dict[str, Any] = {
+            'apple_music_id': artist.apple_music_id,
+            'apple_music_url': artist.apple_music_url,
             'biography': artist.biography,
-            
-            # External IDs
+            'country': artist.country,
+            'created_at': artist.created_at.isoformat() if artist.created_at else None,
             'discogs_id': artist.discogs_id,
-            'apple_music_id': artist.apple_music_id,
-            'spotify_id': artist.spotify_id,
-            'lastfm_mbid': artist.lastfm_mbid,
-            
-            # URLs
             'discogs_url': artist.discogs_url,
-            'apple_music_url': artist.apple_music_url,
-            'spotify_url': artist.spotify_url,
-            'lastfm_url': artist.lastfm_url,
-            'wikipedia_url': artist.wikipedia_url,
-            
-            # Artist details
-            'genres': artist.genres,
-            'popularity': artist.popularity,
             'followers': artist.followers,
-            'country': artist.country,
             'formed_date': artist.formed_date,
-            
-            # Images
-            'images': [
-                {
-                    'url': img.url,
-                    'type': img.type,
-                    'width': img.width,
-                    'height': img.height,
-                }
-                for img in artist.images
-            ],
-            
-            # Local images if available
+            'genres': artist.genres,
+            'id': artist.id,
+            'images': [dict(zip(_DB_IMG_KEYS, _DB_IMG_GETTER(img))) for img in artist.images],
+            'lastfm_mbid': artist.lastfm_mbid,
+            'lastfm_url': artist.lastfm_url,
             'local_images': {
-                size: str(path) if path else None
-                for size, path in artist.local_images.items()
+                size: str(artist.local_images[size]) if artist.local_images[size] else None
+                for size in sorted(artist.local_images)
             },
-            
-            # Metadata
-            'created_at': artist.created_at.isoformat() if artist.created_at else None,
+            'name': artist.name,
+            'popularity': artist.popularity,
+            'raw_data': None,
+            'services': None,
+            'spotify_id': artist.spotify_id,
+            'spotify_url': artist.spotify_url,
             'updated_at': artist.updated_at.isoformat() if artist.updated_at else None,
+            'wikipedia_url': artist.wikipedia_url,
         }
         
         # Add enrichment data if requested
         if include_enrichment and artist.raw_data:
-            data['services'] = ArtistSerializer._serialize_enrichment_data(artist)
+            data['services'] = _canonicalize(ArtistSerializer._serialize_enrichment_data(artist))
             # Also include raw_data for debugging and data access
-            data['raw_data'] = artist.raw_data
+            data['raw_data'] = _canonicalize(artist.raw_data)
+        else:
+            del data['raw_data'], data['services']
         
         return data
     
@@ -437,36 +569,34 @@ class ArtistSerializer:
         """Serialize enrichment data from all services."""
         services = {}
         
-        if hasattr(artist, 'raw_data') and artist.raw_data:
+        raw_data = getattr(artist, 'raw_data', None)
+        if raw_data:
             # Apple Music data
-            if 'apple_music' in artist.raw_data:
-                apple_data = artist.raw_data['apple_music']
-                services['apple_music'] = ArtistSerializer._serialize_apple_music_data(apple_data)
+            if 'apple_music' in raw_data:
+                services['apple_music'] = ArtistSerializer._serialize_apple_music_data(raw_data['apple_music'])
             
             # Spotify data
-            if 'spotify' in artist.raw_data:
-                spotify_data = artist.raw_data['spotify']
-                services['spotify'] = ArtistSerializer._serialize_spotify_data(spotify_data)
+            if 'spotify' in raw_data:
+                services['spotify'] = ArtistSerializer._serialize_spotify_data(raw_data['spotify'])
             
             # Last.fm data
-            if 'lastfm' in artist.raw_data:
-                lastfm_data = artist.raw_data['lastfm']
-                services['lastfm'] = ArtistSerializer._serialize_lastfm_data(lastfm_data)
+            if 'lastfm' in raw_data:
+                services['lastfm'] = ArtistSerializer._serialize_lastfm_data(raw_data['lastfm'])
             
             # Discogs data (including original name)
-            if 'discogs' in artist.raw_data:
-                services['discogs'] = artist.raw_data['discogs']
+            if 'discogs' in raw_data:
+                services['discogs'] = raw_data['discogs']
             
             # TheAudioDB data
-            if 'theaudiodb' in artist.raw_data:
-                services['theaudiodb'] = artist.raw_data['theaudiodb']
+            if 'theaudiodb' in raw_data:
+                services['theaudiodb'] = raw_data['theaudiodb']
         
         return services
     
     @staticmethod
     def _serialize_apple_music_data(apple_data: Any) -> Dict[str, Any]:
         """Serialize Apple Music artist data."""
-        if hasattr(apple_data, '__dict__'):
+        if isinstance(apple_data, ArtistAppleMusicData):
             return {
                 'id': getattr(apple_data, 'id', None),
                 'url': getattr(apple_data, 'url', None),
@@ -481,7 +611,7 @@ class ArtistSerializer:
     @staticmethod
     def _serialize_spotify_data(spotify_data: Any) -> Dict[str, Any]:
         """Serialize Spotify artist data."""
-        if hasattr(spotify_data, '__dict__'):
+        if isinstance(spotify_data, ArtistSpotifyData):
             return {
                 'id': getattr(spotify_data, 'id', None),
                 'url': getattr(spotify_data, 'url', None),
@@ -496,7 +626,7 @@ class ArtistSerializer:
     @staticmethod
     def _serialize_lastfm_data(lastfm_data: Any) -> Dict[str, Any]:
         """Serialize Last.fm artist data."""
-        if hasattr(lastfm_data, '__dict__'):
+        if isinstance(lastfm_data, ArtistLastFmData):
             return {
                 'name': getattr(lastfm_data, 'name', None),
                 'url': getattr(lastfm_data, 'url', None),
@@ -527,10 +657,10 @@ class ArtistSerializer:
         data = ArtistSerializer.to_dict(artist, include_enrichment)
         
         # Default JSON options
-        json_options = {
+        # Keys are already in sorted order (see to_dict), so sort_keys is not needed
+        json_options: Dict[str, Any] = {
             'indent': 2,
             'ensure_ascii': False,
-            'sort_keys': True,
             'default': ReleaseSerializer._json_serializer
         }
         json_options.update(kwargs)
@@ -549,7 +679,7 @@ class ArtistSerializer:
             Dictionary suitable for database insertion
         """
         return {
-            'id': artist.id or f"{artist.name.lower().replace(' ', '-')}-{int(datetime.now().timestamp())}",
+            'id': artist.id or f"{artist.name.lower().replace(' ', '-')}-{ArtistSerializer._batch_timestamp()}",
             'name': artist.name,
             'biography': artist.biography,
             'discogs_id': artist.discogs_id,
@@ -574,15 +704,17 @@ class ArtistSerializer:
             'raw_data': json.dumps(artist.raw_data, default=ReleaseSerializer._json_serializer) if artist.raw_data else '{}'
         }
     
+    @staticmethod
+    def _batch_timestamp() -> int:
+        """Get the integer timestamp used for generated artist IDs."""
+        processed_at = getattr(_batch_state, 'processed_at', None)
+        moment = datetime.fromisoformat(processed_at) if processed_at else datetime.now()
+        return int(moment.timestamp())
+    
     @staticmethod
     def _db_serialize_image(image: Image) -> Dict[str, Any]:
         """Serialize image for database storage."""
-        return {
-            'url': image.url,
-            'type': image.type,
-            'width': image.width,
-            'height': image.height
-        }
+        return dict(zip(_DB_IMG_KEYS, _DB_IMG_GETTER(image)))
     
     @staticmethod
     def _serialize_enrichment_for_db(artist: Artist) -> str:
@@ -3,9 +3,141 @@
 import html
 import re
 import unicodedata
+from functools import lru_cache
 from typing import Any, Dict, List, Union
 
 
+# Translation table for clean_for_json: maps lone CR to LF and deletes all
+# other C0 control characters except tab (9) and newline (10)
+_CONTROL_TABLE = dict.fromkeys(list(range(0, 9)) + [11, 12] + list(range(14, 32)), None)
+_CONTROL_TABLE[ord('\r')] = '\n'
+
+# Characters that make clean_for_json do more than strip(): control characters,
+# CR, lone surrogates, and the '&' that starts any HTML entity
+_NEEDS_CLEAN = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F\r&\ud800-\udfff]')
+
+# Precompiled patterns used by the cleaning functions
+_RE_HTML_TAG = re.compile(r'<[^>]+>')
+_RE_WHITESPACE_RUN = re.compile(r'\s+')
+_RE_DISCOGS_NUM = re.compile(r'\s*\(\d+\)$')
+
+# Characters kept by clean_for_url besides separators
+_URL_CHARS = frozenset('abcdefghijklmnopqrstuvwxyz0123456789')
+
+
+def _is_url_char(char: str) -> bool:
+    """Check whether a character is kept by clean_for_url."""
+    return char in _URL_CHARS
+
+
+def _build_slug_table(keep) -> Dict[int, Any]:
+    """Build an ASCII translate table mapping separators to '-' and dropping non-kept characters."""
+    table = {}
+    for code in range(128):
+        char = chr(code)
+        if char.isspace() or char in '-_':
+            table[code] = '-'
+        elif not keep(char):
+            table[code] = None
+    return table
+
+
+_FILENAME_TABLE = _build_slug_table(str.isalnum)
+_URL_TABLE = _build_slug_table(_is_url_char)
+
+
+def _slugify(text: str, table: Dict[int, Any], keep) -> str:
+    """
+    Turn lowercased text into hyphen-separated words in a single pass.
+    
+    Whitespace, hyphens and underscores become separators, characters rejected
+    by keep are dropped, and repeated or leading/trailing hyphens are removed.
+    """
+    if text.isascii():
+        mapped = text.translate(table)
+    else:
+        mapped = ''.join(
+            '-' if char.isspace() or char in '-_' else char if keep(char) else ''
+            for char in text
+        )
+    return '-'.join(part for part in mapped.split('-') if part)
+
+
+# Implementations behind the TextCleaner methods. Artist names, labels, genres
+# and countries repeat across a collection, so inputs up to _MAX_CACHED_LENGTH
+# go through the lru_cache wrappers below; longer ones (serialized documents,
+# biographies) are unique and would only fill the cache, so they are not memoized.
+_MAX_CACHED_LENGTH = 256
+
+
+def _clean_for_json_impl(text: str) -> str:
+    """Run the full clean_for_json pipeline on a non-empty string."""
+    # Handle HTML entities first
+    text = html.unescape(text)
+    
+    # Remove null bytes and normalize CRLF to LF; lone CRs are handled
+    # by the translate below
+    text = text.replace('\x00', '').replace('\r\n', '\n')
+    
+    # Ensure proper UTF-8 encoding by dropping lone surrogates; ASCII text
+    # is always valid, so skip the round-trip for it
+    if not text.isascii():
+        text = text.encode('utf-8', errors='ignore').decode('utf-8')
+    
+    # Normalize CR to LF and remove control characters except for common
+    # whitespace: newlines (\n = 10) and tabs (\t = 9)
+    cleaned = text.translate(_CONTROL_TABLE)
+    
+    # Normalize Unicode to NFC form (canonical decomposition + composition)
+    cleaned = unicodedata.normalize('NFC', cleaned)
+    
+    # Remove DEL characters
+    cleaned = cleaned.replace('\x7f', '')
+    
+    return cleaned.strip()
+
+
+def _clean_for_filename_impl(text: str, max_length: int) -> str:
+    """Build a filename-safe slug from a non-empty string."""
+    # Lowercase, turn separators into single hyphens and drop problematic characters
+    text = _slugify(text.lower(), _FILENAME_TABLE, str.isalnum)
+    
+    # Truncate if too long
+    if len(text) > max_length:
+        text = text[:max_length].rstrip('-')
+    
+    return text or "unknown"
+
+
+def _clean_for_url_impl(text: str) -> str:
+    """Build a URL-safe slug from a non-empty string."""
+    # Only the parts of clean_for_json that can change the slug: entities,
+    # control characters (some count as whitespace), lone surrogates and
+    # NFC composition
+    if '&' in text:
+        text = html.unescape(text)
+    text = text.translate(_CONTROL_TABLE)
+    if not text.isascii():
+        text = text.encode('utf-8', errors='ignore').decode('utf-8')
+        text = unicodedata.normalize('NFC', text)
+    
+    # Lowercase, turn separators into single hyphens and keep only a-z, 0-9
+    return _slugify(text.lower(), _URL_TABLE, _is_url_char)
+
+
+def _clean_discogs_artist_name_impl(artist_name: str) -> str:
+    """Strip Discogs numbering from a non-empty artist name."""
+    # Remove trailing numbers in parentheses (e.g., "(2)", "(10)")
+    # This regex matches a space followed by parentheses containing only digits at the end
+    return _RE_DISCOGS_NUM.sub('', artist_name).strip()
+
+
+_clean_for_json_cached = lru_cache(maxsize=8192)(_clean_for_json_impl)
+_clean_for_filename_cached = lru_cache(maxsize=4096)(_clean_for_filename_impl)
+_clean_for_url_cached = lru_cache(maxsize=4096)(_clean_for_url_impl)
+_clean_discogs_artist_name_cached = lru_cache(maxsize=4096)(_clean_discogs_artist_name_impl)
+
+
 class TextCleaner:
     """Utility class for cleaning and normalizing text data."""
     
@@ -30,32 +162,14 @@ class TextCleaner:
         if not text or not isinstance(text, str):
             return ""
         
-        # Handle HTML entities first
-        text = html.unescape(text)
-        
-        # Remove null bytes and normalize line endings
-        text = text.replace('\x00', '')  # Remove null bytes
-        text = text.replace('\r\n', '\n')  # Normalize CRLF to LF
-        text = text.replace('\r', '\n')   # Normalize CR to LF
-        
-        # Ensure proper UTF-8 encoding
-        try:
-            text = text.encode('utf-8', errors='ignore').decode('utf-8')
-        except (UnicodeDecodeError, UnicodeEncodeError):
-            # If encoding fails, remove non-ASCII characters
-            text = ''.join(char for char in text if ord(char) < 127)
-        
-        # Remove control characters except for common whitespace
-        # Keep newlines (\n = 10), tabs (\t = 9), and regular spaces (32+)
-        cleaned = ''.join(char for char in text if ord(char) >= 32 or char in '\n\t')
-        
-        # Normalize Unicode to NFC form (canonical decomposition + composition)
-        cleaned = unicodedata.normalize('NFC', cleaned)
+        # Fast path: most titles and names need nothing beyond whitespace trimming,
+        # so keep them out of the cache
+        if not _NEEDS_CLEAN.search(text) and unicodedata.is_normalized('NFC', text):
+            return text.strip()
         
-        # Remove any remaining problematic characters
-        cleaned = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]', '', cleaned)
-        
-        return cleaned.strip()
+        if len(text) <= _MAX_CACHED_LENGTH:
+            return _clean_for_json_cached(text)
+        return _clean_for_json_impl(text)
     
     @staticmethod
     def clean_for_filename(text: str, max_length: int = 255) -> str:
@@ -72,26 +186,9 @@ class TextCleaner:
         if not text or not isinstance(text, str):
             return "unknown"
         
-        # Convert to lowercase and strip
-        text = text.lower().strip()
-        
-        # Replace spaces and common separators with hyphens
-        text = re.sub(r'[\s\-_]+', '-', text)
-        
-        # Remove or replace problematic characters
-        text = re.sub(r'[^\w\-]', '', text)
-        
-        # Remove multiple consecutive hyphens
-        text = re.sub(r'-+', '-', text)
-        
-        # Remove leading/trailing hyphens
-        text = text.strip('-')
-        
-        # Truncate if too long
-        if len(text) > max_length:
-            text = text[:max_length].rstrip('-')
-        
-        return text or "unknown"
+        if len(text) <= _MAX_CACHED_LENGTH:
+            return _clean_for_filename_cached(text, max_length)
+        return _clean_for_filename_impl(text, max_length)
     
     @staticmethod
     def clean_for_url(text: str) -> str:
@@ -107,25 +204,9 @@ class TextCleaner:
         if not text or not isinstance(text, str):
             return ""
         
-        # First clean for JSON to handle encoding issues
-        text = TextCleaner.clean_for_json(text)
-        
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Replace spaces and common separators with hyphens
-        text = re.sub(r'[\s\-_]+', '-', text)
-        
-        # Keep only alphanumeric characters and hyphens
-        text = re.sub(r'[^a-z0-9\-]', '', text)
-        
-        # Remove multiple consecutive hyphens
-        text = re.sub(r'-+', '-', text)
-        
-        # Remove leading/trailing hyphens
-        text = text.strip('-')
-        
-        return text
+        if len(text) <= _MAX_CACHED_LENGTH:
+            return _clean_for_url_cached(text)
+        return _clean_for_url_impl(text)
     
     @staticmethod
     def truncate_with_ellipsis(text: str, max_length: int) -> str:
@@ -168,17 +249,13 @@ class TextCleaner:
         # Clean the text first
         text = TextCleaner.clean_for_json(text)
         
-        # Split by double newlines (paragraph breaks)
-        paragraphs = text.split('\n\n')
-        
-        if not paragraphs:
-            return ""
-        
-        first_paragraph = paragraphs[0].strip()
+        # Split off the first paragraph only; the rest is never needed whole
+        first_paragraph, separator, rest = text.partition('\n\n')
+        first_paragraph = first_paragraph.strip()
         
         # If the first paragraph is too short, try to include the next one
-        if len(first_paragraph) < 100 and len(paragraphs) > 1:
-            second_paragraph = paragraphs[1].strip()
+        if len(first_paragraph) < 100 and separator:
+            second_paragraph = rest.partition('\n\n')[0].strip()
             combined = f"{first_paragraph}\n\n{second_paragraph}"
             if len(combined) <= max_length:
                 first_paragraph = combined
@@ -190,24 +267,47 @@ class TextCleaner:
         return first_paragraph
     
     @staticmethod
-    def clean_data_recursively(data: Any) -> Any:
+    def clean_data_recursively(data: Any, in_place: bool = False) -> Any:
         """
         Recursively clean all text data in a nested structure.
         
         Args:
             data: Data structure (dict, list, or primitive)
+            in_place: Clean dicts and lists in place instead of copying them
             
         Returns:
             Cleaned data structure
         """
-        if isinstance(data, dict):
-            return {key: TextCleaner.clean_data_recursively(value) for key, value in data.items()}
-        elif isinstance(data, list):
-            return [TextCleaner.clean_data_recursively(item) for item in data]
-        elif isinstance(data, str):
+        if isinstance(data, str):
             return TextCleaner.clean_for_json(data)
-        else:
+        if not isinstance(data, (dict, list)):
             return data
+        
+        # Walk the structure with an explicit stack, copying each container
+        # once on the way down unless the caller owns it
+        copy = not in_place
+        if copy:
+            data = dict(data) if isinstance(data, dict) else list(data)
+        
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            items = node.items() if isinstance(node, dict) else enumerate(node)
+            for key, value in items:
+                if isinstance(value, str):
+                    cleaned = TextCleaner.clean_for_json(value)
+                    if cleaned is not value:
+                        node[key] = cleaned
+                elif isinstance(value, dict):
+                    if copy:
+                        value = node[key] = dict(value)
+                    stack.append(value)
+                elif isinstance(value, list):
+                    if copy:
+                        value = node[key] = list(value)
+                    stack.append(value)
+        
+        return data
     
     @staticmethod
     def remove_html_tags(text: str) -> str:
@@ -224,10 +324,10 @@ class TextCleaner:
             return ""
         
         # Remove HTML tags
-        clean = re.sub(r'<[^>]+>', '', text)
+        clean = _RE_HTML_TAG.sub('', text)
         
         # Clean up extra whitespace
-        clean = re.sub(r'\s+', ' ', clean)
+        clean = _RE_WHITESPACE_RUN.sub(' ', clean)
         
         return clean.strip()
     
@@ -245,11 +345,14 @@ class TextCleaner:
         if not text or not isinstance(text, str):
             return ""
         
-        # Replace multiple spaces with single spaces
-        text = re.sub(r' +', ' ', text)
+        # Replace multiple spaces with single spaces; each pass shrinks every
+        # run, so this converges in a few passes for real text
+        while '  ' in text:
+            text = text.replace('  ', ' ')
         
         # Replace multiple newlines with double newlines
-        text = re.sub(r'\n\n+', '\n\n', text)
+        while '\n\n\n' in text:
+            text = text.replace('\n\n\n', '\n\n')
         
         # Remove trailing whitespace from lines
         text = '\n'.join(line.rstrip() for line in text.split('\n'))
@@ -290,8 +393,11 @@ def clean_discogs_artist_name(artist_name: str) -> str:
     if not artist_name or not isinstance(artist_name, str):
         return artist_name
     
-    # Remove trailing numbers in parentheses (e.g., "(2)", "(10)")
-    # This regex matches a space followed by parentheses containing only digits at the end
-    cleaned = re.sub(r'\s*\(\d+\)$', '', artist_name)
+    # Most names cannot carry a numbering suffix; "$" in the pattern also
+    # matches before a final newline, hence the last two characters
+    if ')' not in artist_name[-2:]:
+        return artist_name.strip()
     
-    return cleaned.strip()
\ No newline at end of file
+    if len(artist_name) <= _MAX_CACHED_LENGTH:
+        return _clean_discogs_artist_name_cached(artist_name)
+    return _clean_discogs_artist_name_impl(artist_name)
\ No newline at end of file
@@ -2,6 +2,7 @@
 
 import json
 import logging
+import orjson
 import requests
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -18,47 +19,105 @@ class V1SiteHelper:
     CACHE_DURATION = timedelta(hours=24)  # Cache for 24 hours
     INDEX_URL = "https://v1.russ.fm/index.json"
     
+    # In-memory copy of the index and lookup tables built from it
+    _index_data: Optional[List[Dict[str, Any]]] = None
+    _index_cached_at: Optional[datetime] = None
+    _id_index: Dict[str, Dict[str, Any]] = {}
+    _artist_index: Dict[str, List[Dict[str, Any]]] = {}
+    
+    @classmethod
+    def _set_index(cls, index_data: List[Dict[str, Any]], cached_at: datetime) -> None:
+        """Keep the index in memory and build the Discogs ID and artist lookups."""
+        id_index = {}
+        artist_index = {}
+        for entry in index_data:
+            # Ensure entry is a dict before using .get()
+            if not isinstance(entry, dict):
+                continue
+            discogs_id = entry.get("discogsRelease")
+            if discogs_id:
+                # Keep the first entry for an ID, matching a linear scan
+                id_index.setdefault(discogs_id, entry)
+            # Handle None/null values and ensure we have a string
+            entry_artist = entry.get("artist")
+            if entry_artist and isinstance(entry_artist, str):
+                artist_index.setdefault(entry_artist.lower(), []).append(entry)
+        
+        cls._index_data = index_data
+        cls._index_cached_at = cached_at
+        cls._id_index = id_index
+        cls._artist_index = artist_index
+    
     @classmethod
     def fetch_index(cls, force_refresh: bool = False) -> List[Dict[str, Any]]:
         """Fetch the v1 site index with caching."""
-        # Check if we have a valid cache
-        if not force_refresh and cls.CACHE_FILE.exists():
+        # Reuse the index already loaded by this process while it is fresh
+        if (not force_refresh and cls._index_data is not None
+                and datetime.now() - cls._index_cached_at < cls.CACHE_DURATION):
+            return cls._index_data
+        
+        # Check if we have a valid cache; an expired one is kept so its
+        # validators can be sent with the conditional request below
+        stale_cache = None
+        if cls.CACHE_FILE.exists():
             try:
-                with open(cls.CACHE_FILE, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
+                cache_data = orjson.loads(cls.CACHE_FILE.read_bytes())
                 
                 # Check if cache is still valid
                 cached_time = datetime.fromisoformat(cache_data.get("cached_at", ""))
-                if datetime.now() - cached_time < cls.CACHE_DURATION:
+                if not force_refresh and datetime.now() - cached_time < cls.CACHE_DURATION:
                     logger.info("Using cached v1 index")
-                    return cache_data.get("index", [])
+                    index_data = cache_data.get("index", [])
+                    cls._set_index(index_data, cached_time)
+                    return index_data
+                stale_cache = cache_data
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
             except (json.JSONDecodeError, ValueError, KeyError) as e:
                 logger.warning(f"Invalid cache file, will refetch: {e}")
         
-        # Fetch fresh data
+        # Fetch fresh data, letting the server answer 304 if nothing changed
+        headers = {}
+        if stale_cache:
+            if stale_cache.get("etag"):
+                headers["If-None-Match"] = stale_cache["etag"]
+            if stale_cache.get("last_modified"):
+                headers["If-Modified-Since"] = stale_cache["last_modified"]
+        
         logger.info("Fetching fresh v1 index from website")
         try:
-            response = requests.get(cls.INDEX_URL, timeout=30)
-            response.raise_for_status()
-            
-            raw_index_data = response.json()
+            response = requests.get(cls.INDEX_URL, headers=headers, timeout=30)
             
-            # Extract the documents array from the nested structure
-            index_data = raw_index_data.get("documents", [])
+            if response.status_code == 304 and stale_cache is not None:
+                logger.info("v1 index not modified, refreshing cache timestamp")
+                index_data = stale_cache.get("index", [])
+                etag = stale_cache.get("etag")
+                last_modified = stale_cache.get("last_modified")
+            else:
+                response.raise_for_status()
+                
+                raw_index_data = orjson.loads(response.content)
+                
+                # Extract the documents array from the nested structure
+                index_data = raw_index_data.get("documents", [])
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
             
             # Cache the data
+            cached_at = datetime.now()
             cache_data = {
-                "cached_at": datetime.now().isoformat(),
+                "cached_at": cached_at.isoformat(),
+                "etag": etag,
+                "last_modified": last_modified,
                 "index": index_data
             }
             
             try:
-                with open(cls.CACHE_FILE, 'w', encoding='utf-8') as f:
-                    json.dump(cache_data, f, indent=2)
+                cls.CACHE_FILE.write_bytes(orjson.dumps(cache_data))
                 logger.info(f"Cached v1 index with {len(index_data)} entries")
             except Exception as e:
                 logger.warning(f"Failed to cache v1 index: {e}")
             
+            cls._set_index(index_data, cached_at)
             return index_data
             
         except requests.exceptions.RequestException as e:
@@ -72,20 +131,8 @@ class V1SiteHelper:
     def find_release_by_discogs_id(cls, discogs_id: str, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
         """Find a release by Discogs ID in the v1 index."""
         try:
-            index_data = cls.fetch_index(force_refresh)
-            
-            # Debug: log the structure of the first entry
-            if index_data and len(index_data) > 0:
-                logger.debug(f"First entry type: {type(index_data[0])}")
-                if isinstance(index_data[0], dict):
-                    logger.debug(f"First entry keys: {list(index_data[0].keys())[:5]}")
-            
-            for entry in index_data:
-                # Ensure entry is a dict before using .get()
-                if isinstance(entry, dict) and entry.get("discogsRelease") == discogs_id:
-                    return entry
-            
-            return None
+            cls.fetch_index(force_refresh)
+            return cls._id_index.get(discogs_id)
             
         except Exception as e:
             logger.error(f"Error searching for release {discogs_id}: {e}")
@@ -95,20 +142,14 @@ class V1SiteHelper:
     def find_artist_images(cls, artist_name: str, force_refresh: bool = False) -> Dict[str, str]:
         """Find all unique artist images for a given artist name."""
         try:
-            index_data = cls.fetch_index(force_refresh)
+            cls.fetch_index(force_refresh)
             
             # Collect unique artist images (case-insensitive search)
             artist_images = {}
-            artist_name_lower = artist_name.lower()
-            
-            for entry in index_data:
-                # Ensure entry is a dict before using .get()
-                if isinstance(entry, dict):
-                    entry_artist = entry.get("artist")
-                    # Handle None/null values and ensure we have a string
-                    if entry_artist and isinstance(entry_artist, str) and entry_artist.lower() == artist_name_lower and entry.get("artistImage"):
-                        # Use the exact artist name from the entry as key
-                        artist_images[entry_artist] = entry["artistImage"]
+            for entry in cls._artist_index.get(artist_name.lower(), ()):
+                if entry.get("artistImage"):
+                    # Use the exact artist name from the entry as key
+                    artist_images[entry["artist"]] = entry["artistImage"]
             
             return artist_images
             
@@ -119,9 +160,14 @@ class V1SiteHelper:
     @classmethod
     def clear_cache(cls):
         """Clear the cached index file."""
+        cls._index_data = None
+        cls._index_cached_at = None
+        cls._id_index = {}
+        cls._artist_index = {}
+        
         if cls.CACHE_FILE.exists():
             try:
                 cls.CACHE_FILE.unlink()
                 logger.info("Cleared v1 index cache")
             except Exception as e:
-                logger.error(f"Failed to clear cache: {e}")
\ No newline at end of file
+                logger.error(f"Failed to clear cache: {e}")
@@ -1,5 +1,7 @@
 """Setup script for Music Collection Manager."""
 
+import os
+
 from setuptools import setup, find_packages
 from pathlib import Path
 
@@ -23,6 +25,21 @@ else:
         "python-dateutil>=2.8.0",
     ]
 
+# Optionally compile CPU-bound modules with mypyc (set MCM_USE_MYPYC=1).
+# The interpreted modules are used when mypyc is not installed. Compiled
+# modules raise TypeError for model fields that do not match their annotations.
+ext_modules = []
+if os.environ.get("MCM_USE_MYPYC") == "1":
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        print("mypyc not available, installing pure-Python modules")
+    else:
+        ext_modules = mypycify([
+            "music_collection_manager/utils/serializers.py",
+            "music_collection_manager/utils/release_verifier.py",
+        ])
+
 setup(
     name="music-collection-manager",
     version="0.1.0",
@@ -34,6 +51,7 @@ setup(
     url="https://github.com/yourusername/music-collection-manager",
     packages=find_packages(),
     include_package_data=True,
+    ext_modules=ext_modules,
     install_requires=requirements,
     extras_require={
         "dev": [
@@ -4,14 +4,28 @@ Test script to demonstrate artist matching and link generation.
 Shows current capabilities and potential improvements.
 """
 
-import json
 import sqlite3
 import random
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 import re
+from functools import lru_cache
 from urllib.parse import quote
 
+import orjson
+
+# Patterns used by normalize_artist_name
+_PAREN_SUFFIX = re.compile(r'\s*\([^)]*\)\s*$')
+_THE_PREFIX = re.compile(r'^The\s+', re.IGNORECASE)
+_NONWORD = re.compile(r'[^\w\s]')
+_WS = re.compile(r'\s+')
+
+# ASCII characters matched by _NONWORD, for the str.translate fast path
+_ASCII_NONWORD_TABLE = {
+    i: None for i in range(128)
+    if not (chr(i).isalnum() or chr(i).isspace() or chr(i) == '_')
+}
+
 @dataclass
 class ArtistInfo:
     name: str
@@ -23,18 +37,31 @@ class ArtistInfo:
     lastfm_url: str = ""
     wikipedia_url: str = ""
 
+@lru_cache(maxsize=1024)
+def _quote(text: str) -> str:
+    """URL-encode text; each artist is encoded for several URLs."""
+    return quote(text)
+
+@lru_cache(maxsize=4096)
 def normalize_artist_name(name: str) -> str:
     """Normalize artist name for better matching."""
     # Remove common suffixes/prefixes
-    normalized = re.sub(r'\s*\([^)]*\)\s*$', '', name)  # Remove (1), (2), etc.
-    normalized = re.sub(r'^The\s+', '', normalized, flags=re.IGNORECASE)  # Remove "The"
-    normalized = re.sub(r'[^\w\s]', '', normalized)  # Remove special chars
-    normalized = re.sub(r'\s+', ' ', normalized).strip().lower()
+    normalized = _PAREN_SUFFIX.sub('', name)  # Remove (1), (2), etc.
+    normalized = _THE_PREFIX.sub('', normalized)  # Remove "The"
+    # Remove special chars
+    if normalized.isascii():
+        normalized = normalized.translate(_ASCII_NONWORD_TABLE)
+    else:
+        normalized = _NONWORD.sub('', normalized)
+    normalized = _WS.sub(' ', normalized).strip().lower()
     return normalized
 
 def get_artists_from_releases(conn: sqlite3.Connection, limit: int = 10) -> List[ArtistInfo]:
     """Extract unique artists from releases table."""
+    # Named column access; a row factory set on the cursor leaves the caller's
+    # connection untouched
     cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
     
     # Get all releases with non-Various artists
     query = """
@@ -47,13 +74,14 @@ def get_artists_from_releases(conn: sqlite3.Connection, limit: int = 10) -> List
     """
     
     cursor.execute(query)
-    rows = cursor.fetchall()
     
     artist_map = {}
     
-    for artists_json, title, release_discogs_id in rows:
+    # Iterate the cursor so rows are fetched in batches rather than all at once
+    for row in cursor:
+        title = row['title']
         try:
-            artists = json.loads(artists_json)
+            artists = orjson.loads(row['artists'])
             for artist in artists:
                 if artist['name'] != 'Various Artists':
                     discogs_id = artist.get('discogs_id', '')
@@ -65,7 +93,7 @@ def get_artists_from_releases(conn: sqlite3.Connection, limit: int = 10) -> List
                         )
                     elif discogs_id in artist_map:
                         artist_map[discogs_id].release_titles.append(title)
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             continue
     
     # Return random sample
@@ -81,16 +109,15 @@ def generate_discogs_url(discogs_id: str) -> str:
 def generate_search_urls(artist_name: str, release_context: Optional[str] = None) -> Dict[str, str]:
     """Generate search URLs for various services."""
     # Clean artist name for searching
-    search_name = quote(artist_name)
+    search_name = _quote(artist_name)
+    normalized_name = normalize_artist_name(artist_name)
     
     # If we have release context, use it for better matching
     if release_context:
-        search_with_context = quote(f"{artist_name} {release_context}")
-        normalized_name = normalize_artist_name(artist_name)
+        search_with_context = _quote(f"{artist_name} {release_context}")
         normalized_context = normalize_artist_name(release_context)
     else:
         search_with_context = search_name
-        normalized_name = normalize_artist_name(artist_name)
     
     urls = {
         'apple_music_search': f"https://music.apple.com/search?term={search_name}",
@@ -1,149 +1,105 @@
 #!/usr/bin/env python
 """
-Test release verification concept without the full service imports.
+Test release verification against the collection database.
 Shows how the matching algorithm would work.
 """
 
-import json
+import io
+import os
 import sqlite3
-import re
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, field
-import difflib
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Dict
 
-@dataclass
-class ReleaseMatch:
-    """Represents a matched release between services."""
-    discogs_title: str
-    service_title: str
-    match_score: float
-    match_type: str  # 'exact', 'fuzzy', 'partial'
+# Add the music_collection_manager to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-class ReleaseVerifier:
-    """Verifies artist matches by comparing releases."""
+from music_collection_manager.utils.release_verifier import ReleaseVerifier
+
+def get_artist_releases(conn: sqlite3.Connection, discogs_artist_ids: List[str]) -> Dict[str, List[str]]:
+    """Get all known releases for several artists from the database in one query."""
+    ids = [str(discogs_id) for discogs_id in discogs_artist_ids]
+    releases = {discogs_id: [] for discogs_id in ids}
     
-    @staticmethod
-    def normalize_title(title: str) -> str:
-        """Normalize album title for comparison."""
-        # Remove common suffixes
-        title = re.sub(r'\s*\([^)]*\)\s*$', '', title)  # Remove (Deluxe Edition), etc.
-        title = re.sub(r'\s*\[[^\]]*\]\s*$', '', title)  # Remove [Remastered], etc.
-        
-        # Remove special characters but keep spaces
-        title = re.sub(r'[^\w\s]', '', title)
-        
-        # Normalize whitespace and case
-        title = ' '.join(title.split()).lower()
-        
-        # Remove common words that cause mismatches
-        skip_words = {'the', 'a', 'an', 'and', '&', 'remastered', 'deluxe', 'edition', 
-                      'expanded', 'anniversary', 'reissue', 'bonus', 'tracks', 'disc'}
-        words = [w for w in title.split() if w not in skip_words]
-        
-        return ' '.join(words)
+    # release_artists is maintained by DatabaseManager from the artists JSON
+    query = f"""
+        SELECT DISTINCT ra.discogs_id, r.title
+        FROM releases r
+        JOIN release_artists ra ON ra.release_id = r.id
+        WHERE ra.discogs_id IN ({', '.join('?' * len(ids))})
+        ORDER BY r.title
+    """
     
-    @staticmethod
-    def match_releases(discogs_releases: List[str], service_releases: List[str]) -> List[ReleaseMatch]:
-        """Match releases between Discogs and a service."""
-        matches = []
-        
-        # Normalize all titles
-        normalized_discogs = {ReleaseVerifier.normalize_title(r): r for r in discogs_releases}
-        normalized_service = {ReleaseVerifier.normalize_title(r): r for r in service_releases}
-        
-        # First pass: exact matches
-        for norm_discogs, orig_discogs in normalized_discogs.items():
-            if norm_discogs in normalized_service:
-                matches.append(ReleaseMatch(
-                    discogs_title=orig_discogs,
-                    service_title=normalized_service[norm_discogs],
-                    match_score=1.0,
-                    match_type='exact'
-                ))
-        
-        # Second pass: fuzzy matches for unmatched releases
-        unmatched_discogs = {k: v for k, v in normalized_discogs.items() 
-                           if not any(m.discogs_title == v for m in matches)}
-        unmatched_service = {k: v for k, v in normalized_service.items() 
-                           if not any(m.service_title == v for m in matches)}
-        
-        for norm_discogs, orig_discogs in unmatched_discogs.items():
-            best_match = None
-            best_score = 0.0
-            
-            for norm_service, orig_service in unmatched_service.items():
-                # Calculate similarity
-                score = difflib.SequenceMatcher(None, norm_discogs, norm_service).ratio()
-                
-                # Boost score if key words match
-                discogs_words = set(norm_discogs.split())
-                service_words = set(norm_service.split())
-                if discogs_words and service_words:
-                    word_overlap = len(discogs_words & service_words) / min(len(discogs_words), len(service_words))
-                    score = (score + word_overlap) / 2
-                
-                if score > best_score and score > 0.7:  # 70% threshold
-                    best_score = score
-                    best_match = orig_service
-            
-            if best_match:
-                matches.append(ReleaseMatch(
-                    discogs_title=orig_discogs,
-                    service_title=best_match,
-                    match_score=best_score,
-                    match_type='fuzzy'
-                ))
-        
-        return matches
+    for discogs_id, title in conn.execute(query, ids):
+        releases[discogs_id].append(title)
     
-    @staticmethod
-    def calculate_confidence(matches: List[ReleaseMatch], total_discogs: int) -> Tuple[float, str]:
-        """Calculate confidence score based on release matches."""
-        if total_discogs == 0:
-            return 0.0, "NO_RELEASES"
-        
-        match_percentage = len(matches) / total_discogs
-        
-        # Calculate weighted score based on match quality
-        if matches:
-            avg_match_score = sum(m.match_score for m in matches) / len(matches)
-            confidence_score = match_percentage * avg_match_score
-        else:
-            confidence_score = 0.0
-        
-        # Determine confidence level
-        if match_percentage >= 0.5 and len(matches) >= 2:
-            confidence = "HIGH"
-        elif match_percentage >= 0.3 or len(matches) >= 1:
-            confidence = "MEDIUM"
-        else:
-            confidence = "LOW"
-        
-        # Special cases
-        if len(matches) >= 5:
-            confidence = "HIGH"  # Many matches = high confidence
-        elif total_discogs == 1 and len(matches) == 1 and matches[0].match_score > 0.9:
-            confidence = "HIGH"  # Single perfect match
-        
-        return confidence_score, confidence
+    return releases
 
-def get_artist_releases(db_path: str, discogs_artist_id: str) -> List[str]:
-    """Get all known releases for an artist from the database."""
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+def verify_test_case(test_case: Dict, actual_releases: List[str]) -> str:
+    """Run the Spotify and Apple Music matching for one test case and return its report."""
+    out = io.StringIO()
+    artist = test_case['artist']
+    discogs_id = test_case['discogs_id']
     
-    query = """
-        SELECT DISTINCT title 
-        FROM releases 
-        WHERE artists LIKE ? 
-        ORDER BY title
-    """
+    print(f"\n🎵 Testing: {artist} (Discogs ID: {discogs_id})", file=out)
+    print("-" * 60, file=out)
     
-    cursor.execute(query, [f'%"discogs_id": "{discogs_artist_id}"%'])
-    releases = [row[0] for row in cursor.fetchall()]
-    conn.close()
+    print(f"📀 Known Releases from Database: {len(actual_releases)}", file=out)
+    for i, release in enumerate(actual_releases[:5], 1):
+        print(f"  {i}. {release}", file=out)
+    if len(actual_releases) > 5:
+        print(f"  ... and {len(actual_releases) - 5} more", file=out)
     
-    return releases
+    # Normalize the Discogs titles once for both services
+    verifier = ReleaseVerifier(actual_releases)
+    
+    # Test Spotify matching
+    print(f"\n🟢 SPOTIFY MATCHING:", file=out)
+    spotify_matches = verifier.match(test_case['simulated_spotify'])
+    spotify_score, spotify_confidence = ReleaseVerifier.calculate_confidence(spotify_matches, len(actual_releases))
+    
+    print(f"  Service Albums: {len(test_case['simulated_spotify'])}", file=out)
+    print(f"  Matches Found: {len(spotify_matches)}/{len(actual_releases)} ({len(spotify_matches)/len(actual_releases)*100:.0f}%)", file=out)
+    print(f"  Confidence Score: {spotify_score:.2f}", file=out)
+    print(f"  Confidence Level: {spotify_confidence}", file=out)
+    
+    if spotify_matches:
+        print(f"  Sample Matches:", file=out)
+        for match in spotify_matches[:3]:
+            print(f"    • {match.discogs_title} → {match.service_title}", file=out)
+            print(f"      ({match.match_type}, score: {match.match_score:.2f})", file=out)
+    
+    # Test Apple Music matching
+    print(f"\n🍎 APPLE MUSIC MATCHING:", file=out)
+    apple_matches = verifier.match(test_case['simulated_apple_music'])
+    apple_score, apple_confidence = ReleaseVerifier.calculate_confidence(apple_matches, len(actual_releases))
+    
+    print(f"  Service Albums: {len(test_case['simulated_apple_music'])}", file=out)
+    print(f"  Matches Found: {len(apple_matches)}/{len(actual_releases)} ({len(apple_matches)/len(actual_releases)*100:.0f}%)", file=out)
+    print(f"  Confidence Score: {apple_score:.2f}", file=out)
+    print(f"  Confidence Level: {apple_confidence}", file=out)
+    
+    if apple_matches:
+        print(f"  Sample Matches:", file=out)
+        for match in apple_matches[:3]:
+            print(f"    • {match.discogs_title} → {match.service_title}", file=out)
+            print(f"      ({match.match_type}, score: {match.match_score:.2f})", file=out)
+    
+    # Overall assessment
+    overall_score = (spotify_score + apple_score) / 2
+    print(f"\n📊 OVERALL ASSESSMENT:", file=out)
+    print(f"  Combined Score: {overall_score:.2f}", file=out)
+    if overall_score >= 0.5:
+        print(f"  Result: HIGH CONFIDENCE - Strong match across services", file=out)
+    elif overall_score >= 0.3:
+        print(f"  Result: MEDIUM CONFIDENCE - Partial match", file=out)
+    else:
+        print(f"  Result: LOW CONFIDENCE - Weak or no match", file=out)
+    
+    print("\n" + "=" * 80, file=out)
+    
+    return out.getvalue()
 
 def test_matching_algorithm():
     """Test the matching algorithm with real and simulated data."""
@@ -226,66 +182,21 @@ def test_matching_algorithm():
     print("RELEASE VERIFICATION MATCHING TEST")
     print("=" * 80)
     
-    for test_case in test_cases:
-        artist = test_case['artist']
-        discogs_id = test_case['discogs_id']
-        
-        print(f"\n🎵 Testing: {artist} (Discogs ID: {discogs_id})")
-        print("-" * 60)
-        
-        # Get actual releases from database
-        actual_releases = get_artist_releases('collection_cache.db', discogs_id)
-        
-        print(f"📀 Known Releases from Database: {len(actual_releases)}")
-        for i, release in enumerate(actual_releases[:5], 1):
-            print(f"  {i}. {release}")
-        if len(actual_releases) > 5:
-            print(f"  ... and {len(actual_releases) - 5} more")
-        
-        # Test Spotify matching
-        print(f"\n🟢 SPOTIFY MATCHING:")
-        spotify_matches = ReleaseVerifier.match_releases(actual_releases, test_case['simulated_spotify'])
-        spotify_score, spotify_confidence = ReleaseVerifier.calculate_confidence(spotify_matches, len(actual_releases))
-        
-        print(f"  Service Albums: {len(test_case['simulated_spotify'])}")
-        print(f"  Matches Found: {len(spotify_matches)}/{len(actual_releases)} ({len(spotify_matches)/len(actual_releases)*100:.0f}%)")
-        print(f"  Confidence Score: {spotify_score:.2f}")
-        print(f"  Confidence Level: {spotify_confidence}")
-        
-        if spotify_matches:
-            print(f"  Sample Matches:")
-            for match in spotify_matches[:3]:
-                print(f"    • {match.discogs_title} → {match.service_title}")
-                print(f"      ({match.match_type}, score: {match.match_score:.2f})")
-        
-        # Test Apple Music matching
-        print(f"\n🍎 APPLE MUSIC MATCHING:")
-        apple_matches = ReleaseVerifier.match_releases(actual_releases, test_case['simulated_apple_music'])
-        apple_score, apple_confidence = ReleaseVerifier.calculate_confidence(apple_matches, len(actual_releases))
-        
-        print(f"  Service Albums: {len(test_case['simulated_apple_music'])}")
-        print(f"  Matches Found: {len(apple_matches)}/{len(actual_releases)} ({len(apple_matches)/len(actual_releases)*100:.0f}%)")
-        print(f"  Confidence Score: {apple_score:.2f}")
-        print(f"  Confidence Level: {apple_confidence}")
-        
-        if apple_matches:
-            print(f"  Sample Matches:")
-            for match in apple_matches[:3]:
-                print(f"    • {match.discogs_title} → {match.service_title}")
-                print(f"      ({match.match_type}, score: {match.match_score:.2f})")
-        
-        # Overall assessment
-        overall_score = (spotify_score + apple_score) / 2
-        print(f"\n📊 OVERALL ASSESSMENT:")
-        print(f"  Combined Score: {overall_score:.2f}")
-        if overall_score >= 0.5:
-            print(f"  Result: HIGH CONFIDENCE - Strong match across services")
-        elif overall_score >= 0.3:
-            print(f"  Result: MEDIUM CONFIDENCE - Partial match")
-        else:
-            print(f"  Result: LOW CONFIDENCE - Weak or no match")
-        
-        print("\n" + "=" * 80)
+    # Get actual releases for every test artist from the database up front
+    conn = sqlite3.connect('collection_cache.db')
+    releases_by_artist = get_artist_releases(conn, [case['discogs_id'] for case in test_cases])
+    conn.close()
+    
+    # Test cases are independent, so verify them in parallel and print the
+    # reports in their original order
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        reports = executor.map(
+            verify_test_case,
+            test_cases,
+            [releases_by_artist[case['discogs_id']] for case in test_cases],
+        )
+        for report in reports:
+            sys.stdout.write(report)
 
 if __name__ == "__main__":
     test_matching_algorithm()
\ No newline at end of file
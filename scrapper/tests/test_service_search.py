@@ -39,7 +39,6 @@ def generate_service_urls(artist_name: str, discogs_id: str, album_context: str
     
     # Add album context searches if provided
     if album_context:
-        album_encoded = quote(album_context)
         combined_encoded = quote(f"{artist_name} {album_context}")
         
         urls['enhanced'] = {
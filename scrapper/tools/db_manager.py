@@ -11,11 +11,14 @@ This tool provides functionality to:
 import argparse
 import json
 import os
+import shutil
+import sqlite3
 import sys
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-from tabulate import tabulate
+from typing import List, Optional, Dict, Any, Iterable, Tuple
 
 import logging
 from music_collection_manager.utils.database import DatabaseManager
@@ -25,12 +28,99 @@ from music_collection_manager.config import setup_logging
 setup_logging(level="INFO")
 logger = logging.getLogger(__name__)
 
+# List statements per sort order; the statement text never changes, so sqlite3's
+# statement cache can reuse the compiled query, and LIMIT is bound (-1 = no limit)
+_LIST_RELEASES = "SELECT id, discogs_id, title, artists, year, date_added FROM releases{order} LIMIT ?"
+_LIST_RELEASES_BY_SORT = {
+    'date_added': _LIST_RELEASES.format(order=" ORDER BY date_added DESC"),
+    'title': _LIST_RELEASES.format(order=" ORDER BY title"),
+    'year': _LIST_RELEASES.format(order=" ORDER BY year DESC"),
+}
+_LIST_ARTISTS = "SELECT id, name, discogs_id, created_at FROM artists{order} LIMIT ?"
+_LIST_ARTISTS_BY_SORT = {
+    'created_at': _LIST_ARTISTS.format(order=" ORDER BY created_at DESC"),
+    'name': _LIST_ARTISTS.format(order=" ORDER BY name"),
+}
+
+# Fields of a release row shown by format_release_table, in column order
+_RELEASE_GETTER = itemgetter('id', 'discogs_id', 'title', 'artists', 'year', 'date_added')
+
+# Shorter queries only get exact matches; a one-character prefix or substring
+# search would match most of the collection
+_MIN_PARTIAL_QUERY = 2
+
+
+def _prefix_range(prefix: str) -> Tuple[str, str]:
+    """Return the (lower, upper) bounds matching every string starting with prefix"""
+    # Appending the highest code point keeps the bound valid UTF-8 and unaffected
+    # by NOCASE folding, unlike bumping the last character (e.g. 'Z' -> '[')
+    return prefix, prefix + '\U0010FFFF'
+
+
+@lru_cache(maxsize=4096)
+def _decode_artists(artists_json: Optional[str]) -> Tuple[Tuple[Optional[str], str], ...]:
+    """Decode a release's artists JSON into (id, name) pairs, once per distinct value"""
+    return tuple((a.get('id'), a.get('name', '')) for a in json.loads(artists_json or '[]'))
+
+
+def _is_number(value: str) -> bool:
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _render_grid(rows: List[List[Any]], headers: List[str]) -> str:
+    """Render rows in the same layout as tabulate's "grid" format"""
+    cells = [['' if value is None else str(value).strip() for value in row] for row in rows]
+    columns = list(zip(*cells)) if cells else [()] * len(headers)
+    
+    # Columns holding only numbers are right-aligned; headers get two spaces of slack
+    numeric = [any(column) and all(_is_number(value) for value in column if value) for column in columns]
+    widths = [max([len(header) + 2, *map(len, column)]) for header, column in zip(headers, columns)]
+    
+    def render_row(values):
+        return "| " + " | ".join(
+            value.rjust(width) if right else value.ljust(width)
+            for value, width, right in zip(values, widths, numeric)
+        ) + " |"
+    
+    rule = "+" + "+".join("-" * (width + 2) for width in widths) + "+"
+    lines = [rule, render_row(headers), rule.replace("-", "=")]
+    for row in cells:
+        lines.append(render_row(row))
+        lines.append(rule)
+    if not cells:
+        lines.append(rule)
+    return "\n".join(lines)
+
 
 class DatabaseManagementTool:
     def __init__(self, db_path: str = "collection_cache.db"):
         self.db = DatabaseManager(db_path)
         self.db_path = db_path
         
+        # One connection for the lifetime of the tool rather than one per call
+        self._conn = sqlite3.connect(db_path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA temp_store = MEMORY")
+        self._conn.execute("PRAGMA cache_size = -64000")
+        
+        self._ensure_indexes()
+        
+    def close(self):
+        """Close the tool's database connection"""
+        self._conn.close()
+        
+    def _ensure_indexes(self):
+        """Create the indexes the search and delete paths rely on"""
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_releases_title_nocase ON releases (title COLLATE NOCASE)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_artists_name_nocase ON artists (name COLLATE NOCASE)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_collection_items_release_id ON collection_items (release_id)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_processing_log_release_id ON processing_log (release_id)")
+        self._conn.commit()
+        
     def backup_before_delete(self) -> str:
         """Create a backup before any delete operation"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -41,187 +131,202 @@ class DatabaseManagementTool:
     
     def search_releases(self, query: str) -> List[Dict[str, Any]]:
         """Search for releases by title or ID"""
-        import sqlite3
         releases = []
+        if not query.strip():
+            return releases
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Try exact ID or Discogs ID match first
+        cursor = self._conn.cursor()
+        
+        # Try exact ID or Discogs ID match first
+        cursor.execute(
+            "SELECT id, discogs_id, title, artists, year, date_added FROM releases WHERE id = ? OR discogs_id = ?",
+            (query, query)
+        )
+        row = cursor.fetchone()
+        rows = [row] if row else []
+        
+        if not rows and '*' in query:
+            # Explicit glob pattern such as "Blue*"; GLOB is case-sensitive, so a
+            # literal prefix is answered from the BINARY title index
             cursor.execute(
-                "SELECT id, discogs_id, title, artists, year, date_added FROM releases WHERE id = ? OR discogs_id = ?",
-                (query, query)
+                "SELECT id, discogs_id, title, artists, year, date_added FROM releases WHERE title GLOB ?",
+                (query,)
             )
-            row = cursor.fetchone()
+            rows = cursor.fetchall()
+        elif not rows:
+            # Exact title, then title prefix (both answered from the NOCASE title
+            # index), then any other title containing the query - ranked in that order
+            matches = {}
+            if not any(c in query for c in '%_'):
+                cursor.execute(
+                    "SELECT id, discogs_id, title, artists, year, date_added FROM releases WHERE title = ? COLLATE NOCASE",
+                    (query,)
+                )
+                matches.update((row['id'], row) for row in cursor.fetchall())
+                
+                if len(query.strip()) >= _MIN_PARTIAL_QUERY:
+                    cursor.execute(
+                        "SELECT id, discogs_id, title, artists, year, date_added FROM releases "
+                        "WHERE title >= ? COLLATE NOCASE AND title < ? COLLATE NOCASE",
+                        _prefix_range(query)
+                    )
+                    for row in cursor.fetchall():
+                        matches.setdefault(row['id'], row)
             
-            if row:
-                releases.append({
-                    'id': row[0],
-                    'discogs_id': row[1],
-                    'title': row[2],
-                    'artists': row[3],
-                    'year': row[4],
-                    'date_added': row[5]
-                })
-            else:
-                # Search by title
+            if len(query.strip()) >= _MIN_PARTIAL_QUERY:
+                # Substring match on the title (LIKE is already case-insensitive)
                 cursor.execute(
-                    "SELECT id, discogs_id, title, artists, year, date_added FROM releases WHERE LOWER(title) LIKE LOWER(?)",
+                    "SELECT id, discogs_id, title, artists, year, date_added FROM releases WHERE title LIKE ?",
                     (f"%{query}%",)
                 )
-                
                 for row in cursor.fetchall():
-                    releases.append({
-                        'id': row[0],
-                        'discogs_id': row[1],
-                        'title': row[2],
-                        'artists': row[3],
-                        'year': row[4],
-                        'date_added': row[5]
-                    })
+                    matches.setdefault(row['id'], row)
+            
+            rows = list(matches.values())
+        
+        releases.extend(dict(row) for row in rows)
         
         return releases
     
     def search_artists(self, query: str) -> List[Dict[str, Any]]:
         """Search for artists by name or ID"""
         artists = []
+        if not query.strip():
+            return artists
         
         # Try exact ID match first
         artist = self.db.get_artist_by_id(query)
         if artist:
             artists.append(artist)
-        else:
+        elif len(query.strip()) >= _MIN_PARTIAL_QUERY:
             # Search by name
             found_artists = self.db.search_artists(query)
             if found_artists:
                 artists.extend(found_artists)
             
-            # If no results, try partial ID match
+            # If no results, try partial ID match as a primary key range
             if not artists:
-                import sqlite3
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute(
-                        "SELECT * FROM artists WHERE id LIKE ? LIMIT 10",
-                        (f"{query}%",)
-                    )
-                    
-                    columns = [col[0] for col in cursor.description]
-                    for row in cursor.fetchall():
-                        data = dict(zip(columns, row))
-                        # Convert to Artist-like object or keep as dict
-                        artists.append(data)
+                cursor = self._conn.cursor()
+                cursor.execute(
+                    "SELECT * FROM artists WHERE id >= ? AND id < ? LIMIT 10",
+                    _prefix_range(query)
+                )
+                
+                # Keep the rows as dicts rather than Artist objects
+                artists.extend(dict(row) for row in cursor)
+        else:
+            # Too short for a partial match, but a one-character name can still match exactly
+            cursor = self._conn.cursor()
+            cursor.execute("SELECT * FROM artists WHERE name = ? COLLATE NOCASE", (query.strip(),))
+            artists.extend(dict(row) for row in cursor)
         
         return artists
     
     def list_releases(self, limit: int = 20, sort_by: str = 'date_added') -> List[Dict[str, Any]]:
         """List releases with their added dates"""
-        import sqlite3
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            query = "SELECT id, discogs_id, title, artists, year, date_added FROM releases"
-            
-            if sort_by == 'date_added':
-                query += " ORDER BY date_added DESC"
-            elif sort_by == 'title':
-                query += " ORDER BY title"
-            elif sort_by == 'year':
-                query += " ORDER BY year DESC"
-            
-            if limit > 0:
-                query += f" LIMIT {limit}"
-            
-            cursor.execute(query)
-            
-            releases = []
-            for row in cursor.fetchall():
-                releases.append({
-                    'id': row[0],
-                    'discogs_id': row[1],
-                    'title': row[2],
-                    'artists': row[3],  # This is JSON
-                    'year': row[4],
-                    'date_added': row[5]
-                })
-            
-            return releases
+        cursor = self._conn.cursor()
+        
+        query = _LIST_RELEASES_BY_SORT.get(sort_by, _LIST_RELEASES.format(order=""))
+        cursor.execute(query, (limit if limit > 0 else -1,))
+        
+        # Build the dicts straight off the cursor rather than from a fetchall() copy;
+        # 'artists' stays as its JSON text
+        return [dict(row) for row in cursor]
     
     def list_artists(self, limit: int = 20, sort_by: str = 'created_at') -> List[Dict[str, Any]]:
         """List artists with their added dates"""
-        import sqlite3
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            query = "SELECT id, name, discogs_id, created_at FROM artists"
-            
-            if sort_by == 'created_at':
-                query += " ORDER BY created_at DESC"
-            elif sort_by == 'name':
-                query += " ORDER BY name"
-            
-            if limit > 0:
-                query += f" LIMIT {limit}"
-            
-            cursor.execute(query)
-            
-            artists = []
-            for row in cursor.fetchall():
-                artists.append({
-                    'id': row[0],
-                    'name': row[1],
-                    'discogs_id': row[2],
-                    'created_at': row[3],
-                    'albums_count': len(self.get_artist_releases(row[0]))
-                })
-            
-            return artists
+        cursor = self._conn.cursor()
+        
+        query = _LIST_ARTISTS_BY_SORT.get(sort_by, _LIST_ARTISTS.format(order=""))
+        cursor.execute(query, (limit if limit > 0 else -1,))
+        rows = cursor.fetchall()
+        
+        # Count the albums of every listed artist with a Discogs ID in one query;
+        # the IDs go in as a single JSON array so --limit 0 can't exceed SQLite's variable limit
+        discogs_ids = list({str(row['discogs_id']) for row in rows if row['discogs_id']})
+        album_counts = {}
+        if discogs_ids:
+            cursor.execute(
+                "SELECT discogs_id, COUNT(DISTINCT release_id) FROM release_artists "
+                "WHERE discogs_id IN (SELECT value FROM json_each(?)) GROUP BY discogs_id",
+                (json.dumps(discogs_ids),)
+            )
+            album_counts = dict(cursor)
+        
+        artists = []
+        for row in rows:
+            artist = dict(row)
+            if artist['discogs_id']:
+                artist['albums_count'] = album_counts.get(str(artist['discogs_id']), 0)
+            else:
+                artist['albums_count'] = len(self.get_artist_releases(artist['id']))
+            artists.append(artist)
+        
+        return artists
     
     def get_artist_releases(self, artist_id: str) -> List[Dict[str, Any]]:
-        """Get all releases for an artist"""
-        import sqlite3
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Get all releases and check if artist is in the artists JSON
-            cursor.execute("SELECT id, title, artists FROM releases")
-            
-            artist_releases = []
-            for row in cursor.fetchall():
-                artists = json.loads(row[2] if row[2] else '[]')
-                
-                for artist in artists:
-                    if artist.get('id') == artist_id or artist.get('name') == artist_id:
-                        artist_releases.append({
-                            'id': row[0],
-                            'title': row[1]
-                        })
-                        break
-            
-            return artist_releases
+        """Get all releases for an artist, with the same fields as list_releases"""
+        cursor = self._conn.cursor()
+        
+        # Releases are linked to artists by Discogs ID through the indexed
+        # release_artists table, so known artists don't need a JSON scan
+        cursor.execute("SELECT discogs_id FROM artists WHERE id = ?", (artist_id,))
+        artist = cursor.fetchone()
+        if artist and artist['discogs_id']:
+            cursor.execute(
+                "SELECT DISTINCT r.id, r.discogs_id, r.title, r.artists, r.year, r.date_added "
+                "FROM release_artists ra JOIN releases r ON r.id = ra.release_id WHERE ra.discogs_id = ?",
+                (str(artist['discogs_id']),)
+            )
+            return [dict(row) for row in cursor]
+        
+        # Otherwise check if artist is in the artists JSON of every release,
+        # unpacking the JSON inside SQLite rather than decoding it in Python
+        cursor.execute("""
+            SELECT id, discogs_id, title, artists, year, date_added FROM releases
+            WHERE EXISTS (
+                SELECT 1 FROM json_each(releases.artists)
+                WHERE json_extract(value, '$.id') = ?1 OR json_extract(value, '$.name') = ?1
+            )
+        """, (artist_id,))
+        
+        return [dict(row) for row in cursor]
     
     def delete_release(self, release_id: str) -> bool:
         """Delete a release and its associated data"""
+        # Find the release
+        cursor = self._conn.execute(
+            "SELECT id FROM releases WHERE id = ? OR discogs_id = ?",
+            (release_id, release_id)
+        )
+        release = cursor.fetchone()
+        
+        if not release:
+            logger.error(f"Release not found: {release_id}")
+            return False
+        
+        return self.delete_release_by_internal_id(release['id'])
+    
+    def delete_release_by_internal_id(self, release_id_internal: str) -> bool:
+        """Delete a release by its internal ID, for callers that have already resolved it"""
         # Create backup first
         self.backup_before_delete()
         
-        import sqlite3
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Find the release
-            cursor.execute(
-                "SELECT id, title FROM releases WHERE id = ? OR discogs_id = ?",
-                (release_id, release_id)
-            )
+        cursor = self._conn.cursor()
+        
+        # Take the write lock up front so the lookup and the three deletes
+        # form one transaction with a single commit
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.execute("SELECT title FROM releases WHERE id = ?", (release_id_internal,))
             release = cursor.fetchone()
             
             if not release:
-                logger.error(f"Release not found: {release_id}")
+                self._conn.rollback()
+                logger.error(f"Release not found: {release_id_internal}")
                 return False
             
-            release_id_internal = release[0]
-            release_info = f"{release[1]} (ID: {release_id_internal})"
+            release_info = f"{release['title']} (ID: {release_id_internal})"
             
             # Delete associated collection items
             cursor.execute("DELETE FROM collection_items WHERE release_id = ?", (release_id_internal,))
@@ -232,55 +337,66 @@ class DatabaseManagementTool:
             # Delete the release
             cursor.execute("DELETE FROM releases WHERE id = ?", (release_id_internal,))
             
-            conn.commit()
-            
-            logger.info(f"Deleted release: {release_info}")
-            
-            # Also delete the JSON and image files
-            self._delete_release_files(release_id_internal)
-            
-            return True
+            self._conn.commit()
+        except Exception:
+            self._conn.rollback()
+            raise
+        
+        logger.info(f"Deleted release: {release_info}")
+        
+        # Also delete the JSON and image files, once the database delete has committed
+        self._delete_release_files(release_id_internal)
+        
+        return True
     
     def delete_artist(self, artist_id: str) -> bool:
         """Delete an artist and optionally their releases"""
+        # Find the artist - try exact match first, then partial ID match
+        id_lower, id_upper = _prefix_range(artist_id) if artist_id else (artist_id, artist_id)
+        cursor = self._conn.execute(
+            "SELECT id FROM artists WHERE id = ? OR name = ? COLLATE NOCASE OR (id >= ? AND id < ?)",
+            (artist_id, artist_id, id_lower, id_upper)
+        )
+        artist = cursor.fetchone()
+        
+        if not artist:
+            logger.error(f"Artist not found: {artist_id}")
+            return False
+        
+        return self.delete_artist_by_internal_id(artist['id'])
+    
+    def delete_artist_by_internal_id(self, artist_id_internal: str) -> bool:
+        """Delete an artist by its internal ID, for callers that have already resolved it"""
         # Create backup first
         self.backup_before_delete()
         
-        import sqlite3
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Find the artist - try exact match first, then partial ID match
-            cursor.execute(
-                "SELECT id, name FROM artists WHERE id = ? OR LOWER(name) = LOWER(?) OR id LIKE ?",
-                (artist_id, artist_id, f"{artist_id}%")
-            )
-            artist = cursor.fetchone()
-            
-            if not artist:
-                logger.error(f"Artist not found: {artist_id}")
-                return False
-            
-            artist_id_internal = artist[0]
-            artist_info = f"{artist[1]} (ID: {artist_id_internal})"
-            
-            # Check if artist has releases
-            artist_releases = self.get_artist_releases(artist_id_internal)
-            if artist_releases:
-                logger.warning(f"Artist {artist_info} has {len(artist_releases)} releases")
-                # Note: We're not deleting releases automatically to be safe
-            
-            # Delete the artist
-            cursor.execute("DELETE FROM artists WHERE id = ?", (artist_id_internal,))
-            
-            conn.commit()
-            
-            logger.info(f"Deleted artist: {artist_info}")
-            
-            # Also delete the artist JSON and image files
-            self._delete_artist_files(artist_id_internal)
-            
-            return True
+        cursor = self._conn.cursor()
+        cursor.execute("SELECT name FROM artists WHERE id = ?", (artist_id_internal,))
+        artist = cursor.fetchone()
+        
+        if not artist:
+            logger.error(f"Artist not found: {artist_id_internal}")
+            return False
+        
+        artist_info = f"{artist['name']} (ID: {artist_id_internal})"
+        
+        # Check if artist has releases
+        artist_releases = self.get_artist_releases(artist_id_internal)
+        if artist_releases:
+            logger.warning(f"Artist {artist_info} has {len(artist_releases)} releases")
+            # Note: We're not deleting releases automatically to be safe
+        
+        # Delete the artist
+        cursor.execute("DELETE FROM artists WHERE id = ?", (artist_id_internal,))
+        
+        self._conn.commit()
+        
+        logger.info(f"Deleted artist: {artist_info}")
+        
+        # Also delete the artist JSON and image files
+        self._delete_artist_files(artist_id_internal)
+        
+        return True
     
     def _delete_release_files(self, release_id: str):
         """Delete release JSON and image files"""
@@ -288,7 +404,6 @@ class DatabaseManagementTool:
         release_path = base_path / release_id
         
         if release_path.exists():
-            import shutil
             shutil.rmtree(release_path)
             logger.info(f"Deleted release files: {release_path}")
     
@@ -298,33 +413,33 @@ class DatabaseManagementTool:
         artist_path = base_path / artist_id
         
         if artist_path.exists():
-            import shutil
             shutil.rmtree(artist_path)
             logger.info(f"Deleted artist files: {artist_path}")
     
-    def format_release_table(self, releases: List[Dict[str, Any]]) -> str:
+    def format_release_table(self, releases: Iterable[Dict[str, Any]]) -> str:
         """Format releases as a table"""
         headers = ["ID", "Discogs ID", "Title", "Artists", "Year", "Date Added"]
         rows = []
         
         for release in releases:
-            artists = release.get('artists', [])
-            if isinstance(artists, str):
-                artists = json.loads(artists)
-            artist_names = ", ".join([a.get('name', '') for a in artists])
+            release_id, discogs_id, title, artists, year, date_added = _RELEASE_GETTER(release)
+            if artists is None or isinstance(artists, str):
+                artist_names = ", ".join([name for _, name in _decode_artists(artists)])
+            else:
+                artist_names = ", ".join([a.get('name', '') for a in artists])
             
             rows.append([
-                release.get('id', ''),  # Show full ID
-                release.get('discogs_id', ''),
-                release.get('title', '')[:40],  # Truncate long titles
+                release_id,  # Show full ID
+                discogs_id,
+                title[:40],  # Truncate long titles
                 artist_names[:30],  # Truncate long artist lists
-                release.get('year', ''),
-                release.get('date_added', '')[:19] if release.get('date_added') else ''
+                year,
+                date_added[:19] if date_added else ''
             ])
         
-        return tabulate(rows, headers=headers, tablefmt="grid")
+        return _render_grid(rows, headers)
     
-    def format_artist_table(self, artists: List[Any]) -> str:
+    def format_artist_table(self, artists: Iterable[Any]) -> str:
         """Format artists as a table"""
         headers = ["ID", "Name", "Discogs ID", "Albums", "Date Added"]
         rows = []
@@ -355,7 +470,7 @@ class DatabaseManagementTool:
                 str(created_at)[:19] if created_at else ''
             ])
         
-        return tabulate(rows, headers=headers, tablefmt="grid")
+        return _render_grid(rows, headers)
 
 
 def main():
@@ -462,11 +577,19 @@ def main():
                     print("Deletion cancelled")
                     return
             
-            # Perform deletion
+            # Perform deletion, reusing the internal ID found above when the
+            # search matched the ID exactly, so the item isn't looked up again
             if args.type == 'release':
-                success = tool.delete_release(args.id)
+                release = releases[0]
+                if args.id in (release['id'], release['discogs_id']):
+                    success = tool.delete_release_by_internal_id(release['id'])
+                else:
+                    success = tool.delete_release(args.id)
             else:  # artist
-                success = tool.delete_artist(args.id)
+                if artist_id == args.id:
+                    success = tool.delete_artist_by_internal_id(artist_id)
+                else:
+                    success = tool.delete_artist(args.id)
             
             if success:
                 print("Deletion completed successfully")
@@ -481,12 +604,10 @@ def main():
             print(f"Processed items: {stats.get('processed_items', 0)}")
             print(f"Enriched items: {stats.get('enriched_items', 0)}")
             
-            # Get total artists count using sqlite3
-            import sqlite3
-            with sqlite3.connect(tool.db_path) as conn:
-                cursor = conn.execute("SELECT COUNT(*) FROM artists")
-                artist_count = cursor.fetchone()[0]
-                print(f"Total artists: {artist_count}")
+            # Get total artists count
+            cursor = tool._conn.execute("SELECT COUNT(*) FROM artists")
+            artist_count = cursor.fetchone()[0]
+            print(f"Total artists: {artist_count}")
         
         elif args.command == 'backup':
             if args.name:
@@ -499,6 +620,8 @@ def main():
     except Exception as e:
         logger.error(f"Error: {e}")
         sys.exit(1)
+    finally:
+        tool.close()
 
 
 if __name__ == "__main__":
@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
 """Standalone script to fetch Discogs artist data and save as JSON."""
 
-import discogs_client
 import json
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
 
-def fetch_discogs_artist_data(artist_id):
+import orjson
+import requests
+
+DISCOGS_API_URL = "https://api.discogs.com"
+
+def fetch_discogs_artist_data(artist_id, keep_raw=False):
     """Fetch complete Discogs artist data and return as JSON."""
     
     # Load config
@@ -28,30 +33,26 @@ def fetch_discogs_artist_data(artist_id):
 
     print(f"✅ Using Discogs token: {token[:10]}...")
 
-    # Initialize client
-    d = discogs_client.Client('DiscogsFetcher/1.0', user_token=token)
+    headers = {
+        "Authorization": f"Discogs token={token}",
+        "User-Agent": "DiscogsFetcher/1.0",
+    }
 
     try:
         print(f"🔍 Fetching artist data for ID: {artist_id}")
-        artist = d.artist(artist_id)
-        
-        print(f"✅ Artist: {artist.name}")
+        # A single request returns the profile, images, URLs, name variations
+        # and members together, so no per-attribute fetches are needed
+        response = requests.get(f"{DISCOGS_API_URL}/artists/{artist_id}", headers=headers, timeout=30)
+        response.raise_for_status()
+        artist_data = response.json()
         
-        # Access all attributes to trigger full data loading
-        profile = artist.profile
-        images = artist.images
-        urls = artist.urls
-        name_variations = artist.name_variations
-        members = artist.members
+        print(f"✅ Artist: {artist_data.get('name', '')}")
         
-        print(f"📝 Profile: {len(profile)} characters")
-        print(f"🖼️ Images: {len(images)} items")
-        print(f"🔗 URLs: {len(urls)} items")
-        print(f"🏷️ Name variations: {len(name_variations)} items")
-        print(f"👥 Members: {len(members)} items")
-        
-        # Get the complete data
-        artist_data = artist.data
+        print(f"📝 Profile: {len(artist_data.get('profile', ''))} characters")
+        print(f"🖼️ Images: {len(artist_data.get('images', []))} items")
+        print(f"🔗 URLs: {len(artist_data.get('urls', []))} items")
+        print(f"🏷️ Name variations: {len(artist_data.get('namevariations', []))} items")
+        print(f"👥 Members: {len(artist_data.get('members', []))} items")
         
         # Create enrichment data structure
         enrichment_data = {
@@ -66,10 +67,13 @@ def fetch_discogs_artist_data(artist_id):
             "members": artist_data.get("members", []),
             "cover_image": artist_data.get("images", [{}])[0].get("resource_url", "") if artist_data.get("images") else "",
             "thumb": artist_data.get("images", [{}])[0].get("uri150", "") if artist_data.get("images") else "",
-            "raw_data": artist_data,
             "fetched_externally": True,
-            "fetch_timestamp": "2025-07-06T13:50:00Z"
+            "fetch_timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         }
+        # The fields used downstream are copied above, so the full response
+        # is only kept on request rather than duplicating them in every file
+        if keep_raw:
+            enrichment_data["raw_data"] = artist_data
         
         return enrichment_data
         
@@ -89,8 +93,7 @@ def save_artist_data(artist_id, data):
     # Save to file
     filename = cache_dir / f"artist_{artist_id}.json"
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        filename.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         
         print(f"✅ Saved artist data to: {filename}")
         return True
@@ -100,18 +103,24 @@ def save_artist_data(artist_id, data):
         return False
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python fetch_discogs_artist.py <artist_id>")
+    args = sys.argv[1:]
+    keep_raw = "--keep-raw" in args
+    if keep_raw:
+        args.remove("--keep-raw")
+    
+    if len(args) != 1:
+        print("Usage: python fetch_discogs_artist.py <artist_id> [--keep-raw]")
         print("Example: python fetch_discogs_artist.py 1206719")
+        print("  --keep-raw  Also store the full Discogs API response under raw_data")
         sys.exit(1)
     
-    artist_id = sys.argv[1]
+    artist_id = args[0]
     
     print(f"🚀 Fetching Discogs data for artist ID: {artist_id}")
     print("=" * 50)
     
     # Fetch the data
-    data = fetch_discogs_artist_data(artist_id)
+    data = fetch_discogs_artist_data(artist_id, keep_raw=keep_raw)
     
     if data:
         # Save to cache file
@@ -7,13 +7,17 @@ Usage:
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+
+import orjson
+
 from music_collection_manager.config import ConfigManager
 from music_collection_manager.utils.database import DatabaseManager
 from music_collection_manager.utils.collection_generator import CollectionGenerator
 from music_collection_manager.utils.image_manager import ImageManager
-from music_collection_manager.utils.serializers import ArtistSerializer
-from music_collection_manager.utils.text_cleaner import clean_for_json
+from music_collection_manager.utils.serializers import ArtistSerializer, ReleaseSerializer
+from music_collection_manager.utils.text_cleaner import TextCleaner
 
 # Setup logging
 logging.basicConfig(
@@ -22,6 +26,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger('regenerate_json')
 
+# Per-file work is small and mostly filesystem I/O, so a handful of threads
+# is enough to overlap the writes
+MAX_WORKERS = 8
+
+
+def _write_release(release, image_manager):
+    """Write one release JSON file.
+
+    Returns:
+        Tuple of (success, release title)
+    """
+    # Save release JSON using the image manager's method
+    json_path = image_manager.save_release_json(
+        release, 
+        release.title, 
+        str(release.discogs_id)
+    )
+    return bool(json_path), release.title
+
+
+def _write_artist(artist, data_path, artists_path, image_manager):
+    """Write one artist JSON file.
+
+    Returns:
+        Tuple of (success, artist name)
+    """
+    # Create artist folder
+    artist_folder = image_manager.sanitize_filename(artist.name)
+    artist_path = Path(data_path) / artists_path / artist_folder
+    artist_path.mkdir(parents=True, exist_ok=True)
+    
+    # Save artist JSON
+    json_path = artist_path / f'{artist_folder}.json'
+    data = ArtistSerializer.to_dict(artist, include_enrichment=True)
+    
+    # Clean the text values before encoding rather than the encoded JSON;
+    # the dict was just built for this write, so clean it in place
+    TextCleaner.clean_data_recursively(data, in_place=True)
+    
+    json_path.write_bytes(orjson.dumps(
+        data,
+        default=ReleaseSerializer._json_serializer,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME,
+    ))
+    return True, artist.name
+
+
 def main():
     """Regenerate all JSON files from database cache."""
     # Load configuration
@@ -44,21 +95,22 @@ def main():
     logger.info('Regenerating release JSON files...')
     
     success_count = 0
-    for i, release in enumerate(releases, 1):
-        try:
-            # Save release JSON using the image manager's method
-            json_path = image_manager.save_release_json(
-                release, 
-                release.title, 
-                str(release.discogs_id)
-            )
-            if json_path:
-                success_count += 1
-                logger.info(f'[{i}/{len(releases)}] Regenerated: {release.title}')
-            else:
-                logger.warning(f'[{i}/{len(releases)}] Failed to save: {release.title}')
-        except Exception as e:
-            logger.error(f'[{i}/{len(releases)}] Error with {release.title}: {e}')
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(_write_release, release, image_manager): release
+            for release in releases
+        }
+        for i, future in enumerate(as_completed(futures), 1):
+            release = futures[future]
+            try:
+                ok, title = future.result()
+                if ok:
+                    success_count += 1
+                    logger.info(f'[{i}/{len(releases)}] Regenerated: {title}')
+                else:
+                    logger.warning(f'[{i}/{len(releases)}] Failed to save: {title}')
+            except Exception as e:
+                logger.error(f'[{i}/{len(releases)}] Error with {release.title}: {e}')
     
     logger.info(f'Successfully regenerated {success_count}/{len(releases)} release JSON files')
     
@@ -68,27 +120,20 @@ def main():
     logger.info('Regenerating artist JSON files...')
     
     artist_success_count = 0
-    for i, artist in enumerate(artists, 1):
-        try:
-            # Create artist folder
-            artist_folder = image_manager.sanitize_filename(artist.name)
-            artist_path = Path(data_path) / artists_path / artist_folder
-            artist_path.mkdir(parents=True, exist_ok=True)
-            
-            # Save artist JSON
-            json_path = artist_path / f'{artist_folder}.json'
-            json_content = ArtistSerializer.to_json(artist, include_enrichment=True)
-            
-            # Clean the JSON content
-            json_content = clean_for_json(json_content)
-            
-            with open(json_path, 'w', encoding='utf-8') as f:
-                f.write(json_content)
-            
-            artist_success_count += 1
-            logger.info(f'[{i}/{len(artists)}] Regenerated: {artist.name}')
-        except Exception as e:
-            logger.error(f'[{i}/{len(artists)}] Error with {artist.name}: {e}')
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(_write_artist, artist, data_path, artists_path, image_manager): artist
+            for artist in artists
+        }
+        for i, future in enumerate(as_completed(futures), 1):
+            artist = futures[future]
+            try:
+                ok, name = future.result()
+                if ok:
+                    artist_success_count += 1
+                    logger.info(f'[{i}/{len(artists)}] Regenerated: {name}')
+            except Exception as e:
+                logger.error(f'[{i}/{len(artists)}] Error with {artist.name}: {e}')
     
     logger.info(f'Successfully regenerated {artist_success_count}/{len(artists)} artist JSON files')
     